@@ -1,4 +1,11 @@
 import os
+import sys
+
+import redis
+from cachelib.file import FileSystemCache
+from flask import Blueprint, g, jsonify
+from sqlalchemy import text
+from superset.security import SupersetSecurityManager
 
 # Superset specific config
 ROW_LIMIT = 5000
@@ -34,25 +41,100 @@ CACHE_CONFIG = {
     'CACHE_REDIS_DB': 1,
 }
 
+# Chart results are invalidated per dataset by the data version in their cache
+# key (see DataVersionSecurityManager below), so they can be kept for a week
 DATA_CACHE_CONFIG = {
     'CACHE_TYPE': 'redis',
-    'CACHE_DEFAULT_TIMEOUT': 86400,
+    'CACHE_DEFAULT_TIMEOUT': 7 * 86400,
     'CACHE_KEY_PREFIX': 'superset_data_',
     'CACHE_REDIS_HOST': REDIS_HOST,
     'CACHE_REDIS_PORT': REDIS_PORT,
     'CACHE_REDIS_DB': 2,
 }
 
-# Celery configuration - Minimal for now
+# Data-version-aware cache keys
+# Ingest (utils/data_versions.py) bumps a version per table in
+# data.dataset_versions. Superset adds the row-level-security key of a dataset
+# to every chart cache key, so extending it with the table's version makes a
+# reload invalidate the cached results of the changed datasets only.
+DATA_VERSIONS_TABLE = 'data.dataset_versions'
+
+
+class DataVersionSecurityManager(SupersetSecurityManager):
+    """Adds the ingest data version of a dataset's table to its cache keys."""
+
+    def data_version(self, datasource):
+        table_name = getattr(datasource, 'table_name', None)
+        database = getattr(datasource, 'database', None)
+        if not table_name or database is None or getattr(datasource, 'sql', None):
+            return None  # virtual datasets have no single table to version
+        name = f"{datasource.schema}.{table_name}" if datasource.schema else table_name
+
+        # Looked up once per request (a chart request computes its key several times)
+        versions = g.setdefault('data_versions', {})
+        key = (database.id, name)
+        if key not in versions:
+            try:
+                with database.get_sqla_engine() as engine, engine.connect() as conn:
+                    row = conn.execute(
+                        text(f"SELECT version, updated_at FROM {DATA_VERSIONS_TABLE} WHERE table_name = :name"),
+                        {'name': name},
+                    ).first()
+            except Exception:
+                row = None  # no versions table in this database
+            versions[key] = f"{row[0]}@{row[1].isoformat()}" if row else None
+        return versions[key]
+
+    def get_rls_cache_key(self, datasource):
+        keys = super().get_rls_cache_key(datasource)
+        version = self.data_version(datasource)
+        return keys + [f"data_version:{version}"] if version else keys
+
+
+CUSTOM_SECURITY_MANAGER = DataVersionSecurityManager
+
+# Task modules of the utils folder (report_tasks.py) - mounted with the project
+UTILS_PATH = os.environ.get('SUPERSET_UTILS_PATH', '/app/superset_home/utils')
+if os.path.isdir(UTILS_PATH) and UTILS_PATH not in sys.path:
+    sys.path.append(UTILS_PATH)
+
+
+# Celery configuration
+# SQL Lab queries use the default queue; statistical reports (ams.* tasks) are
+# routed to the "reports" queue, served by its own worker with concurrency 2 and
+# prefetch 1 (superset-worker-reports in docker-compose.yml). The prefetch
+# multiplier below applies to the default workers.
 class CeleryConfig:
     broker_url = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
-    imports = ('superset.sql_lab',)
+    imports = ('superset.sql_lab', 'report_tasks')
     result_backend = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
     worker_prefetch_multiplier = 10
     task_acks_late = True
+    task_routes = {'ams.*': {'queue': 'reports'}}
+    # Report results stay pollable for a week
+    result_expires = 7 * 86400
 
 CELERY_CONFIG = CeleryConfig
 
+# SQL Lab results backend
+# Async SQL Lab queries (run by the default-queue superset-worker) store their
+# results here instead of sending them through the web process. With msgpack the
+# result is serialized as Arrow columns and zlib-compressed by Superset - several
+# times smaller than the row-wise JSON. The directory is on the superset-data
+# volume shared by the web server and the worker. Exports beyond SQL_MAX_ROW go
+# through utils/export_results.py, which streams to Parquet/Arrow files.
+RESULTS_BACKEND_DIR = os.environ.get('RESULTS_BACKEND_DIR', '/app/superset/sqllab_results')
+RESULTS_BACKEND = FileSystemCache(
+    RESULTS_BACKEND_DIR,
+    threshold=int(os.environ.get('RESULTS_BACKEND_MAX_FILES', 2000)),
+    default_timeout=86400,
+)
+RESULTS_BACKEND_USE_MSGPACK = True
+
+# Rows stored per SQL Lab query and rows rendered in the browser
+SQL_MAX_ROW = int(os.environ.get('SQL_MAX_ROW', 1_000_000))
+DISPLAY_MAX_ROW = 10000
+
 # Flask-WTF flag for CSRF
 WTF_CSRF_ENABLED = True
 # Add endpoints that need to be exempt from CSRF protection
@@ -76,6 +158,34 @@ FEATURE_FLAGS = {
 # Additional configuration
 ENABLE_PROXY_FIX = True
 
+# Readiness check for load balancers and the production serving mode: unlike
+# the built-in /health (process is up), /health/ready also checks the metadata
+# database and Redis and answers 503 if either is unreachable
+health_blueprint = Blueprint('ams_health', __name__)
+
+
+@health_blueprint.route('/health/ready')
+def health_ready():
+    from superset.extensions import db
+
+    checks = {}
+    try:
+        db.session.execute(text('SELECT 1'))
+        checks['metadata_db'] = 'ok'
+    except Exception as e:
+        checks['metadata_db'] = str(e)
+    try:
+        redis.Redis(host=REDIS_HOST, port=int(REDIS_PORT), socket_timeout=2).ping()
+        checks['redis'] = 'ok'
+    except Exception as e:
+        checks['redis'] = str(e)
+
+    ok = all(result == 'ok' for result in checks.values())
+    return jsonify(status='ok' if ok else 'error', checks=checks), 200 if ok else 503
+
+
+BLUEPRINTS = [health_blueprint]
+
 # Async query configuration
 GLOBAL_ASYNC_QUERIES_REDIS_CONFIG = {
     'port': REDIS_PORT,
@@ -84,6 +194,9 @@ GLOBAL_ASYNC_QUERIES_REDIS_CONFIG = {
 }
 
 # SQL Lab configuration
-SUPERSET_WEBSERVER_TIMEOUT = 300
-SQLLAB_ASYNC_TIME_LIMIT_SEC = 300
+# Also read by gunicorn_config.py for the worker timeout
+SUPERSET_WEBSERVER_TIMEOUT = int(os.environ.get('SUPERSET_WEBSERVER_TIMEOUT', 300))
+# Async queries run on the worker and write to RESULTS_BACKEND, so large
+# exports may take far longer than a web request
+SQLLAB_ASYNC_TIME_LIMIT_SEC = 6 * 60 * 60
 SQLLAB_TIMEOUT = 300
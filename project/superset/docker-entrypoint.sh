@@ -30,30 +30,21 @@ superset fab list-users | grep -q admin || {
 echo "🔐 Initializing Superset..."
 superset init
 
-# Auto-import dashboards from mounted folder
+# Auto-import dashboards from mounted folder - one process for all bundles,
+# unchanged bundles (checksum manifest) are skipped
 echo "📂 Checking for dashboards to import..."
 DASHBOARD_DIR="/app/superset_home/dashboards"
-if [ -d "$DASHBOARD_DIR" ]; then
-    DASHBOARD_COUNT=$(find "$DASHBOARD_DIR" -name "*.json" -o -name "*.zip" | wc -l)
-    if [ "$DASHBOARD_COUNT" -gt 0 ]; then
-        echo "📦 Found $DASHBOARD_COUNT dashboard file(s) to import..."
-        for dashboard_file in "$DASHBOARD_DIR"/*.{json,zip}; do
-            if [ -f "$dashboard_file" ]; then
-                echo "  ↳ Importing: $(basename "$dashboard_file")"
-                superset import-dashboards -p "$dashboard_file" 2>/dev/null && \
-                    echo "    ✅ Imported successfully" || \
-                    echo "    ⚠️  Already exists or import failed (this is normal)"
-            fi
-        done
-    else
-        echo "  ℹ️  No dashboard files found in $DASHBOARD_DIR"
-    fi
-else
-    echo "  ℹ️  Dashboard directory not found: $DASHBOARD_DIR"
-fi
+python /app/superset_home/utils/import_dashboards.py "$DASHBOARD_DIR" || \
+    echo "  ⚠️  Some dashboards failed to import (retried on next start)"
 
 echo "✅ Initialization complete!"
-echo "🌐 Starting Superset web server on 0.0.0.0:8088..."
 
-# Start Superset
-exec superset run -h 0.0.0.0 -p 8088 --with-threads --reload --debugger
+# Start Superset - SUPERSET_SERVE_MODE=production runs gunicorn with several
+# workers (gunicorn_config.py), anything else the Flask dev server with reloader
+if [ "${SUPERSET_SERVE_MODE:-development}" = "production" ]; then
+    echo "🌐 Starting Superset (gunicorn, ${GUNICORN_WORKERS:-auto} workers) on 0.0.0.0:8088..."
+    exec gunicorn --config /app/superset_home/gunicorn_config.py "superset.app:create_app()"
+else
+    echo "🌐 Starting Superset development server on 0.0.0.0:8088..."
+    exec superset run -h 0.0.0.0 -p 8088 --with-threads --reload --debugger
+fi
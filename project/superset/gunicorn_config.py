@@ -0,0 +1,60 @@
+"""
+Gunicorn configuration for the production serving mode
+(SUPERSET_SERVE_MODE=production, see docker-entrypoint.sh).
+
+    gunicorn --config /app/superset_home/gunicorn_config.py "superset.app:create_app()"
+
+Every setting can be overridden by environment:
+
+    GUNICORN_WORKERS        worker processes (default: 2 x CPUs + 1, at most 8)
+    GUNICORN_WORKER_CLASS   gthread (default), sync or gevent
+    GUNICORN_THREADS        threads per gthread worker (default 4)
+    GUNICORN_BIND           listen address (default 0.0.0.0:8088)
+    SUPERSET_WEBSERVER_TIMEOUT  request timeout in seconds, shared with superset_config.py
+"""
+
+import os
+import sys
+import multiprocessing
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8088')
+
+# Each Superset worker holds ~300 MB, hence the cap
+workers = int(os.environ.get('GUNICORN_WORKERS', min(2 * multiprocessing.cpu_count() + 1, 8)))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Slow chart queries may take up to SUPERSET_WEBSERVER_TIMEOUT; gunicorn must not
+# kill the worker before Superset gives up on the query itself
+timeout = int(os.environ.get('SUPERSET_WEBSERVER_TIMEOUT', 300)) + 10
+graceful_timeout = 30
+keepalive = 5
+
+# Import the app once in the master; workers fork with it already loaded.
+# Not with gevent, which has to patch the standard library before the import.
+preload_app = worker_class != 'gevent'
+
+# Recycle workers now and then to return memory fragmented by large results
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = 100
+
+# Superset puts long chart states into URLs and headers
+limit_request_line = 0
+limit_request_field_size = 0
+
+# ENABLE_PROXY_FIX in superset_config.py trusts X-Forwarded-* from the proxy
+forwarded_allow_ips = '*'
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Drop metadata database connections inherited from the preloading master."""
+    if not preload_app or 'superset.extensions' not in sys.modules:
+        return
+    app = server.app.wsgi()
+    with app.app_context():
+        from superset.extensions import db
+        db.engine.dispose()
@@ -6,49 +6,334 @@ Generates univariate and bivariate statistics for the dataset.
 Creates summary tables and insights that can be visualized in Superset.
 """
 
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from pandas.api.types import union_categoricals
 
+from detect_encoding import resolve_encoding
+from instrumentation import Tracer
 
-def load_data(csv_path: str = "/tmp/data.csv") -> pd.DataFrame:
-    """Load the Austrian employment CSV data"""
-    df = pd.read_csv(csv_path, sep=';', encoding='utf-8')
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+except ImportError:  # cache is skipped without pyarrow
+    pa = None
 
-    # Convert date column
-    df['Datum'] = pd.to_datetime(df['Datum'])
 
-    # Extract year and month for analysis
+# Fixed schema for the AMS extract - used by the streaming loader so every
+# chunk gets the same compact dtypes instead of inferred object columns
+CATEGORICAL_COLS = ['RGSName', 'Geschlecht', 'AusbCode', 'HoeAbgAusbildung']
+CSV_DTYPES = {
+    'Datum': 'category',
+    'RGSCode': 'int32',
+    'RGSName': 'category',
+    'Geschlecht': 'category',
+    'AusbCode': 'category',
+    'HoeAbgAusbildung': 'category',
+    'BESTAND': 'int32',
+    'ZUGANG': 'int32',
+    'ABGANG': 'int32',
+}
+
+DEFAULT_MEMORY_LIMIT_MB = 512
+
+# Columnar cache of loaded frames (Arrow IPC files, memory-mapped on read)
+CACHE_DIR = os.environ.get('ANALYSIS_CACHE_DIR', '/tmp/analysis_cache')
+
+# Columns _add_date_columns() derives from Datum
+DATE_COLUMNS = ['Year', 'Month', 'YearMonth']
+
+
+def _add_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Extract year and month for analysis"""
     df['Year'] = df['Datum'].dt.year
     df['Month'] = df['Datum'].dt.month
     df['YearMonth'] = df['Datum'].dt.to_period('M')
-
     return df
 
 
-def univariate_statistics(df: pd.DataFrame) -> pd.DataFrame:
+def csv_encoding(csv_path: str, encoding: str = None) -> str:
+    """`encoding` if given, else the detected (cached) encoding of the file - utf-8 if undetectable."""
+    return encoding or resolve_encoding(csv_path) or 'utf-8'
+
+
+def _estimate_chunk_rows(csv_path: str, memory_limit_mb: int, chunks_in_flight: int = 4) -> int:
+    """
+    Size CSV chunks so the raw text of a few chunks stays well under the limit.
+    Uses the average line length of the first 64KB as the per-row estimate.
+    """
+    with open(csv_path, 'rb') as f:
+        sample = f.read(65536)
+    lines = max(sample.count(b'\n'), 1)
+    bytes_per_row = max(len(sample) // lines, 1)
+    # Parsed rows take several times their text size while in flight
+    budget = memory_limit_mb * 1024 * 1024 // (chunks_in_flight * 8)
+    return max(budget // bytes_per_row, 1000)
+
+
+def load_data_streaming(csv_path: str = "/tmp/data.csv",
+                        encoding: str = None,
+                        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+                        chunk_rows: int = None) -> pd.DataFrame:
+    """
+    Load the CSV in bounded chunks with a fixed, compact schema.
+
+    Categoricals for the text columns, small ints for codes and counts, and
+    `Datum` is parsed once per distinct value instead of once per row.
+    Raises MemoryError if the typed frame would exceed memory_limit_mb.
+    encoding=None detects it, see csv_encoding().
+    """
+    encoding = csv_encoding(csv_path, encoding)
+    if chunk_rows is None:
+        chunk_rows = _estimate_chunk_rows(csv_path, memory_limit_mb)
+
+    limit_bytes = memory_limit_mb * 1024 * 1024
+    chunks = []
+    used_bytes = 0
+
+    reader = pd.read_csv(csv_path, sep=';', encoding=encoding,
+                         dtype=CSV_DTYPES, chunksize=chunk_rows)
+    for chunk in reader:
+        used_bytes += chunk.memory_usage(deep=True).sum()
+        if used_bytes > limit_bytes:
+            raise MemoryError(
+                f"Typed data exceeds memory limit of {memory_limit_mb} MB "
+                f"after {sum(len(c) for c in chunks):,} rows"
+            )
+        chunks.append(chunk)
+
+    if not chunks:
+        df = pd.read_csv(csv_path, sep=';', encoding=encoding, dtype=CSV_DTYPES)
+    else:
+        # Categories differ per chunk - union them so concat keeps the category dtype
+        columns = {}
+        for col in chunks[0].columns:
+            if isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+                columns[col] = union_categoricals([c[col] for c in chunks])
+            else:
+                columns[col] = np.concatenate([c[col].to_numpy() for c in chunks])
+        chunks.clear()
+        df = pd.DataFrame(columns)
+
+    # One date parse per distinct month instead of per row
+    datum = df['Datum'].cat.rename_categories(
+        pd.to_datetime(df['Datum'].cat.categories)
+    )
+    df['Datum'] = datum.astype(datum.cat.categories.dtype)
+
+    return _add_date_columns(df)
+
+
+def _cache_path(csv_path: str, streaming: bool) -> Path:
+    """
+    Cache file for a CSV, keyed by its size, mtime and a hash of its first
+    and last MB. The load mode is part of the key since dtypes differ.
+    """
+    stat = os.stat(csv_path)
+    digest = hashlib.blake2b(digest_size=8)
+    with open(csv_path, 'rb') as f:
+        digest.update(f.read(1024 * 1024))
+        if stat.st_size > 2 * 1024 * 1024:
+            f.seek(-1024 * 1024, os.SEEK_END)
+            digest.update(f.read())
+
+    source = hashlib.blake2b(str(Path(csv_path).resolve()).encode(), digest_size=4).hexdigest()
+    mode = 'stream' if streaming else 'full'
+    name = f"{Path(csv_path).stem}-{source}-{mode}-{stat.st_size}-{stat.st_mtime_ns}-{digest.hexdigest()}.arrow"
+    return Path(CACHE_DIR) / name
+
+
+def _read_cache(cache_file: Path, columns: list = None) -> pd.DataFrame:
+    """Memory-map a cached Arrow file and convert only the requested columns."""
+    with pa.memory_map(str(cache_file), 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas()
+
+
+def _write_cache(cache_file: Path, df: pd.DataFrame):
+    """Write the typed frame as an uncompressed Arrow file and drop stale versions."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    prefix = cache_file.name.rsplit('-', 3)[0]
+    for stale in cache_file.parent.glob(f"{prefix}-*.arrow"):
+        stale.unlink()
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with pa.OSFile(str(tmp_file), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_file, cache_file)
+
+
+def load_data(csv_path: str = "/tmp/data.csv", streaming: bool = False,
+              memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+              use_cache: bool = True, columns: list = None,
+              tracer: Tracer = None, encoding: str = None) -> pd.DataFrame:
+    """
+    Load the Austrian employment CSV data
+
+    streaming=True reads in bounded chunks with a fixed compact schema,
+    see load_data_streaming().
+
+    use_cache=True keeps a typed Arrow copy in CACHE_DIR; later calls on the
+    unchanged file memory-map it instead of parsing the CSV. `columns` limits
+    the result to the columns a caller needs.
+
+    encoding=None reads the CSV with its detected encoding (utf-8 or cp1252),
+    see csv_encoding().
+
+    Sub-steps (cache read, parse, date conversion, cache write) are recorded
+    as stages of `tracer`.
+    """
+    tracer = tracer or Tracer()
+    cache_file = _cache_path(csv_path, streaming) if use_cache and pa is not None else None
+    if cache_file is not None and cache_file.exists():
+        with tracer.stage('cache_read') as stage:
+            df = _read_cache(cache_file, columns)
+            stage.rows = len(df)
+        return df
+
+    if streaming:
+        with tracer.stage('read_csv_streaming') as stage:
+            df = load_data_streaming(csv_path, encoding, memory_limit_mb=memory_limit_mb)
+            stage.rows = len(df)
+    else:
+        with tracer.stage('read_csv') as stage:
+            df = pd.read_csv(csv_path, sep=';', encoding=csv_encoding(csv_path, encoding))
+            stage.rows = len(df)
+
+        # Convert date column
+        with tracer.stage('parse_dates', rows=len(df)):
+            df['Datum'] = pd.to_datetime(df['Datum'])
+
+            df = _add_date_columns(df)
+
+    if cache_file is not None:
+        with tracer.stage('cache_write', rows=len(df)):
+            try:
+                _write_cache(cache_file, df)
+            except OSError as e:
+                print(f"⚠️  Could not write cache {cache_file}: {e}")
+
+    return df[columns] if columns is not None else df
+
+
+# Rows per block in univariate_statistics - bounds the float64 working copy
+UNIVARIATE_BLOCK_ROWS = 1 << 20
+
+
+def _moments(values: np.ndarray) -> dict:
+    """
+    Count, sum, min, max, mean and M2 (sum of squared deviations) for every
+    column of a 2D array, in one blocked pass. Sums of integer data are exact
+    up to 2**53. Block results are merged with
+    Chan's parallel update, so the variance stays stable on long columns.
+    """
+    k = values.shape[1]
+    n = np.zeros(k)
+    col_sum = np.zeros(k)
+    mean = np.zeros(k)
+    m2 = np.zeros(k)
+    col_min = np.full(k, np.inf)
+    col_max = np.full(k, -np.inf)
+
+    for start in range(0, len(values), UNIVARIATE_BLOCK_ROWS):
+        block = values[start:start + UNIVARIATE_BLOCK_ROWS].astype('float64')
+        valid = ~np.isnan(block)
+        block_n = valid.sum(axis=0)
+        if not block_n.any():
+            continue
+        block_sum = np.where(valid, block, 0).sum(axis=0)
+        col_sum += block_sum
+        with np.errstate(invalid='ignore', divide='ignore'):
+            block_mean = np.where(block_n > 0, block_sum / block_n, 0)
+        block_m2 = (np.where(valid, block - block_mean, 0) ** 2).sum(axis=0)
+        col_min = np.fmin(col_min, np.nanmin(np.where(valid, block, np.inf), axis=0))
+        col_max = np.fmax(col_max, np.nanmax(np.where(valid, block, -np.inf), axis=0))
+
+        total = n + block_n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = block_mean - mean
+            mean = np.where(total > 0, mean + delta * block_n / total, 0)
+            m2 = m2 + block_m2 + np.where(total > 0, delta ** 2 * n * block_n / total, 0)
+        n = total
+
+    return {'n': n, 'sum': col_sum, 'mean': mean, 'm2': m2, 'min': col_min, 'max': col_max}
+
+
+def _percentile_label(q: float) -> str:
+    return f"P{q * 100:g}"
+
+
+def univariate_statistics(df: pd.DataFrame, columns: list = None,
+                          percentiles: list = None) -> pd.DataFrame:
     """
     Calculate univariate statistics for numeric columns
     Returns: DataFrame with statistics
+
+    columns defaults to BESTAND, ZUGANG and ABGANG but can be any numeric
+    columns (e.g. derived metrics). Median, Q1 and Q3 are always reported;
+    extra `percentiles` (0-1) are added as P<n> columns after Q3.
+    Moments come from one blocked pass over all columns, quantiles from one
+    selection per column.
     """
-    numeric_cols = ['BESTAND', 'ZUGANG', 'ABGANG']
+    numeric_cols = list(columns) if columns is not None else ['BESTAND', 'ZUGANG', 'ABGANG']
+    extra = [q for q in (percentiles or []) if q not in (0.25, 0.5, 0.75)]
+    quantiles = [0.25, 0.5, 0.75] + extra
+
+    moments = _moments(df[numeric_cols].to_numpy(dtype='float64', na_value=np.nan))
 
     stats = []
-    for col in numeric_cols:
-        stats.append({
+    for i, col in enumerate(numeric_cols):
+        series = df[col]
+        is_int = pd.api.types.is_integer_dtype(series.dtype)
+        count = int(moments['n'][i])
+
+        # Single selection for all requested quantiles (linear interpolation, like pandas)
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        q_values = np.quantile(values, quantiles) if count else np.full(len(quantiles), np.nan)
+
+        mean = moments['mean'][i] if count else np.nan
+        std = np.sqrt(moments['m2'][i] / (count - 1)) if count > 1 else np.nan
+        total = moments['sum'][i]
+        col_min = moments['min'][i] if count else np.nan
+        col_max = moments['max'][i] if count else np.nan
+        if is_int:
+            # Report integer columns as integers, like the pandas reductions do
+            total = int(total)
+            col_min, col_max = (int(col_min), int(col_max)) if count else (np.nan, np.nan)
+
+        row = {
             'Variable': col,
-            'Count': df[col].count(),
-            'Mean': df[col].mean(),
-            'Median': df[col].median(),
-            'Std': df[col].std(),
-            'Min': df[col].min(),
-            'Q1': df[col].quantile(0.25),
-            'Q3': df[col].quantile(0.75),
-            'Max': df[col].max(),
-            'Sum': df[col].sum(),
-            'CV': (df[col].std() / df[col].mean() * 100) if df[col].mean() != 0 else 0  # Coefficient of variation
+            'Count': count,
+            'Mean': mean,
+            'Median': q_values[1],
+            'Std': std,
+            'Min': col_min,
+            'Q1': q_values[0],
+            'Q3': q_values[2],
+        }
+        for q, value in zip(extra, q_values[3:]):
+            row[_percentile_label(q)] = value
+        row.update({
+            'Max': col_max,
+            'Sum': total,
+            'CV': (std / mean * 100) if mean != 0 else 0  # Coefficient of variation
         })
+        stats.append(row)
 
+    return univariate_table(stats)
+
+
+def univariate_table(stats: list) -> pd.DataFrame:
+    """Build the univariate table from one dict per variable, rounded for readability."""
     stats_df = pd.DataFrame(stats)
 
     # Round for readability
@@ -67,16 +352,34 @@ def categorical_statistics(df: pd.DataFrame) -> dict:
 
     stats = {}
     for col in categorical_cols:
-        freq = df[col].value_counts().reset_index()
-        freq.columns = [col, 'Count']
-        freq['Percentage'] = (freq['Count'] / freq['Count'].sum() * 100).round(2)
+        stats[col] = frequency_table(value_counts_first_seen(df[col]), col)
 
-        # Add cumulative percentage
-        freq['Cumulative_Pct'] = freq['Percentage'].cumsum().round(2)
+    return stats
 
-        stats[col] = freq
 
-    return stats
+def value_counts_first_seen(series: pd.Series) -> pd.Series:
+    """
+    Counts sorted descending, ties in order of first appearance - the same
+    for object and categorical columns, so both load modes print one report.
+    """
+    counts = series.value_counts(sort=False)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categorical counts come in category order; reorder by first occurrence
+        codes = series.cat.codes.to_numpy()
+        counts = counts.iloc[pd.unique(codes[codes >= 0])]
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+def frequency_table(counts: pd.Series, col: str) -> pd.DataFrame:
+    """Shape category counts (sorted descending) into a frequency table."""
+    freq = counts.reset_index()
+    freq.columns = [col, 'Count']
+    freq['Percentage'] = (freq['Count'] / freq['Count'].sum() * 100).round(2)
+
+    # Add cumulative percentage
+    freq['Cumulative_Pct'] = freq['Percentage'].cumsum().round(2)
+
+    return freq
 
 
 def bivariate_correlation(df: pd.DataFrame) -> pd.DataFrame:
@@ -88,36 +391,96 @@ def bivariate_correlation(df: pd.DataFrame) -> pd.DataFrame:
     return corr_matrix
 
 
-def gender_analysis(df: pd.DataFrame) -> pd.DataFrame:
+# Aggregation cube: one grouped pass over these dimensions, every grouped
+# analysis below is a roll-up of it
+CUBE_DIMS = ['YearMonth', 'RGSName', 'Geschlecht', 'HoeAbgAusbildung']
+CUBE_MEASURES = ['BESTAND', 'ZUGANG', 'ABGANG']
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Analyze employment by gender (bivariate analysis)
+    Aggregate the frame once over CUBE_DIMS.
+
+    Keeps sum, count, sum of squares, min and max per measure, so sums, means
+    and standard deviations of any roll-up can be derived without rescanning
+    the data. Rows with missing dimension values are kept (as NaN keys) so
+    totals match the raw frame.
     """
-    gender_stats = df.groupby('Geschlecht').agg({
-        'BESTAND': ['sum', 'mean', 'median', 'std'],
-        'ZUGANG': ['sum', 'mean'],
-        'ABGANG': ['sum', 'mean']
-    }).round(2)
+    values = df[CUBE_MEASURES]
+    squares = (values.astype('float64') ** 2).add_suffix('_sq')
+    grouped = pd.concat([values, squares], axis=1).groupby(
+        [df[dim] for dim in CUBE_DIMS], observed=True, dropna=False, sort=True
+    )
+
+    sums = grouped.sum()
+    counts = grouped[CUBE_MEASURES].count().add_suffix('_count')
+    mins = grouped[CUBE_MEASURES].min().add_suffix('_min')
+    maxs = grouped[CUBE_MEASURES].max().add_suffix('_max')
+
+    cube = pd.concat([sums[CUBE_MEASURES].add_suffix('_sum'), counts,
+                      sums[[f'{col}_sq' for col in CUBE_MEASURES]], mins, maxs], axis=1)
+    return cube
+
+
+def rollup(cube: pd.DataFrame, by) -> pd.DataFrame:
+    """
+    Roll the cube up to the `by` dimension(s), adding mean and std per measure.
+    Groups with a missing key are dropped, like a groupby on the raw frame.
+    """
+    agg = {}
+    for col in CUBE_MEASURES:
+        agg.update({f'{col}_sum': 'sum', f'{col}_count': 'sum', f'{col}_sq': 'sum',
+                    f'{col}_min': 'min', f'{col}_max': 'max'})
+    result = cube.groupby(level=by, observed=True, sort=True).agg(agg)
+
+    for col in CUBE_MEASURES:
+        n = result[f'{col}_count']
+        total = result[f'{col}_sum']
+        result[f'{col}_mean'] = total / n
+        # Sample variance (ddof=1) from the running sums, clipped at 0 for rounding noise
+        var = (result[f'{col}_sq'] - total.astype('float64') ** 2 / n) / (n - 1)
+        result[f'{col}_std'] = np.sqrt(var.clip(lower=0)).where(n > 1)
+
+    return result
+
+
+def _cube_for(df: pd.DataFrame, cube: pd.DataFrame = None) -> pd.DataFrame:
+    return cube if cube is not None else build_cube(df)
 
-    # Flatten column names
-    gender_stats.columns = ['_'.join(col).strip() for col in gender_stats.columns.values]
+
+def gender_analysis(df: pd.DataFrame, cube: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Analyze employment by gender (bivariate analysis)
+    Medians can't be rolled up, so BESTAND_median is one extra pass over the column.
+    """
+    totals = rollup(_cube_for(df, cube), 'Geschlecht')
+    totals['BESTAND_median'] = df.groupby('Geschlecht', observed=True)['BESTAND'].median()
+    return gender_table(totals)
+
+
+def gender_table(totals: pd.DataFrame) -> pd.DataFrame:
+    """Shape per-gender totals (rollup() layout plus BESTAND_median) into the report table."""
+    gender_stats = totals[[
+        'BESTAND_sum', 'BESTAND_mean', 'BESTAND_median', 'BESTAND_std',
+        'ZUGANG_sum', 'ZUGANG_mean',
+        'ABGANG_sum', 'ABGANG_mean',
+    ]].round(2)
     gender_stats = gender_stats.reset_index()
 
     return gender_stats
 
 
-def education_analysis(df: pd.DataFrame) -> pd.DataFrame:
+def education_analysis(df: pd.DataFrame, cube: pd.DataFrame = None) -> pd.DataFrame:
     """
     Analyze employment by education level
     Top education levels by BESTAND
     """
-    edu_stats = df.groupby('HoeAbgAusbildung').agg({
-        'BESTAND': ['sum', 'mean', 'count'],
-        'ZUGANG': 'sum',
-        'ABGANG': 'sum'
-    }).round(2)
+    return education_table(rollup(_cube_for(df, cube), 'HoeAbgAusbildung'))
+
 
-    # Flatten columns
-    edu_stats.columns = ['_'.join(col).strip() for col in edu_stats.columns.values]
+def education_table(totals: pd.DataFrame) -> pd.DataFrame:
+    """Shape per-education totals (rollup() layout) into the report table."""
+    edu_stats = totals[['BESTAND_sum', 'BESTAND_mean', 'BESTAND_count', 'ZUGANG_sum', 'ABGANG_sum']].round(2)
     edu_stats = edu_stats.reset_index()
 
     # Sort by total BESTAND
@@ -131,17 +494,16 @@ def education_analysis(df: pd.DataFrame) -> pd.DataFrame:
     return edu_stats.head(15)
 
 
-def regional_analysis(df: pd.DataFrame) -> pd.DataFrame:
+def regional_analysis(df: pd.DataFrame, cube: pd.DataFrame = None) -> pd.DataFrame:
     """
     Analyze employment by region
     """
-    regional_stats = df.groupby('RGSName').agg({
-        'BESTAND': ['sum', 'mean'],
-        'ZUGANG': 'sum',
-        'ABGANG': 'sum'
-    }).round(2)
+    return regional_table(rollup(_cube_for(df, cube), 'RGSName'))
+
 
-    regional_stats.columns = ['_'.join(col).strip() for col in regional_stats.columns.values]
+def regional_table(totals: pd.DataFrame) -> pd.DataFrame:
+    """Shape per-region totals (rollup() layout) into the report table."""
+    regional_stats = totals[['BESTAND_sum', 'BESTAND_mean', 'ZUGANG_sum', 'ABGANG_sum']].round(2)
     regional_stats = regional_stats.reset_index()
     regional_stats = regional_stats.sort_values('BESTAND_sum', ascending=False)
 
@@ -151,17 +513,16 @@ def regional_analysis(df: pd.DataFrame) -> pd.DataFrame:
     return regional_stats
 
 
-def temporal_analysis(df: pd.DataFrame) -> pd.DataFrame:
+def temporal_analysis(df: pd.DataFrame, cube: pd.DataFrame = None) -> pd.DataFrame:
     """
     Analyze trends over time
     """
-    temporal_stats = df.groupby('YearMonth').agg({
-        'BESTAND': ['sum', 'mean', 'std'],
-        'ZUGANG': 'sum',
-        'ABGANG': 'sum'
-    }).round(2)
+    return temporal_table(rollup(_cube_for(df, cube), 'YearMonth'))
 
-    temporal_stats.columns = ['_'.join(col).strip() for col in temporal_stats.columns.values]
+
+def temporal_table(totals: pd.DataFrame) -> pd.DataFrame:
+    """Shape per-month totals (rollup() layout, Period index) into the report table."""
+    temporal_stats = totals[['BESTAND_sum', 'BESTAND_mean', 'BESTAND_std', 'ZUGANG_sum', 'ABGANG_sum']].round(2)
     temporal_stats = temporal_stats.reset_index()
     temporal_stats['YearMonth'] = temporal_stats['YearMonth'].astype(str)
 
@@ -175,6 +536,43 @@ def temporal_analysis(df: pd.DataFrame) -> pd.DataFrame:
     return temporal_stats
 
 
+def top_education_crosstab(cube: pd.DataFrame, n: int = 5) -> pd.DataFrame:
+    """
+    Gender x education cross-tab of BESTAND for the top n education levels,
+    rolled up from the cube
+    """
+    return crosstab_table(rollup(cube, 'HoeAbgAusbildung')['BESTAND_sum'],
+                          rollup(cube, ['Geschlecht', 'HoeAbgAusbildung'])['BESTAND_sum'], n)
+
+
+def crosstab_table(by_edu: pd.Series, by_gender_edu: pd.Series, n: int = 5) -> pd.DataFrame:
+    """
+    Cross-tab from BESTAND totals per education and per (gender, education)
+    """
+    top_edu = by_edu.nlargest(n).index
+    by_gender_edu = by_gender_edu[by_gender_edu.index.get_level_values('HoeAbgAusbildung').isin(top_edu)]
+    crosstab = by_gender_edu.unstack('HoeAbgAusbildung')
+    crosstab.columns = pd.Index(list(crosstab.columns), name='HoeAbgAusbildung')
+    crosstab.index = pd.Index(list(crosstab.index), name='Geschlecht')
+
+    return crosstab
+
+
+def key_insights(cube: pd.DataFrame) -> dict:
+    """
+    Totals and counts for the KEY INSIGHTS block, from the cube
+    """
+    totals = cube[['BESTAND_sum', 'ZUGANG_sum', 'ABGANG_sum']].sum()
+    return {
+        'BESTAND': totals['BESTAND_sum'],
+        'ZUGANG': totals['ZUGANG_sum'],
+        'ABGANG': totals['ABGANG_sum'],
+        'gender_split': rollup(cube, 'Geschlecht')['BESTAND_sum'].to_dict(),
+        'regions': cube.index.get_level_values('RGSName').dropna().nunique(),
+        'education_levels': cube.index.get_level_values('HoeAbgAusbildung').dropna().nunique(),
+    }
+
+
 def cross_tabulation(df: pd.DataFrame, row_var: str, col_var: str, value_var: str = 'BESTAND') -> pd.DataFrame:
     """
     Create cross-tabulation for two categorical variables
@@ -189,10 +587,90 @@ def cross_tabulation(df: pd.DataFrame, row_var: str, col_var: str, value_var: st
     return crosstab
 
 
-def generate_statistical_report(csv_path: str = "/tmp/data.csv"):
+# Independent full-data analyses and the columns each one reads. In parallel
+# mode every worker memory-maps just these columns from the Arrow cache.
+PARALLEL_ANALYSES = {
+    'univariate': (univariate_statistics, ['BESTAND', 'ZUGANG', 'ABGANG']),
+    'categorical': (categorical_statistics, ['Geschlecht', 'HoeAbgAusbildung', 'RGSName', 'AusbCode']),
+    'correlation': (bivariate_correlation, ['BESTAND', 'ZUGANG', 'ABGANG']),
+    'cube': (build_cube, CUBE_DIMS + CUBE_MEASURES),
+}
+
+
+def _run_analysis(name: str, csv_path: str, streaming: bool, profile=None, trace_malloc=None):
+    """
+    Process pool worker: read the needed columns from the cache and run one
+    analysis. Returns the result and the worker's stage records.
+    """
+    func, columns = PARALLEL_ANALYSES[name]
+    tracer = Tracer(f'report_worker_{name}', profile, trace_malloc)
+    with tracer.stage(name) as stage:
+        df = load_data(csv_path, streaming=streaming, use_cache=True, columns=columns, tracer=tracer)
+        stage.rows = len(df)
+        result = func(df)
+    return result, tracer.stages
+
+
+def compute_analyses(df: pd.DataFrame, csv_path: str = None, streaming: bool = False,
+                     workers: int = None, tracer: Tracer = None) -> dict:
+    """
+    Run every analysis of the report and return the tables by name.
+
+    With workers > 1 the analyses in PARALLEL_ANALYSES run in a process pool.
+    Workers read the data from the Arrow cache written by load_data() rather
+    than receiving pickled copies; without a cache file this falls back to
+    running them here. Grouped analyses are roll-ups of the cube.
+
+    Each analysis is a stage of `tracer` (worker stages are merged in).
+    """
+    tracer = tracer or Tracer()
+    parallel = (workers or 1) > 1 and csv_path is not None and pa is not None \
+        and _cache_path(csv_path, streaming).exists()
+    if (workers or 1) > 1 and not parallel:
+        print("⚠️  No Arrow cache for this file - running analyses sequentially")
+
+    results = {}
+    if parallel:
+        with tracer.stage('parallel_analyses', rows=len(df)):
+            with ProcessPoolExecutor(max_workers=min(workers, len(PARALLEL_ANALYSES))) as pool:
+                futures = {name: pool.submit(_run_analysis, name, csv_path, streaming,
+                                             tracer.profile, tracer.trace_malloc)
+                           for name in PARALLEL_ANALYSES}
+                for name, future in futures.items():
+                    results[name], stages = future.result()
+                    tracer.extend(stages, parent='parallel_analyses')
+    else:
+        for name, (func, _) in PARALLEL_ANALYSES.items():
+            with tracer.stage(name, rows=len(df)):
+                results[name] = func(df)
+
+    cube = results['cube']
+    grouped = {
+        'gender': lambda: gender_analysis(df, cube),
+        'education': lambda: education_analysis(df, cube),
+        'regional': lambda: regional_analysis(df, cube),
+        'temporal': lambda: temporal_analysis(df, cube),
+        'crosstab': lambda: top_education_crosstab(cube, 5),
+        'insights': lambda: key_insights(cube),
+    }
+    for name, func in grouped.items():
+        with tracer.stage(name, rows=len(cube)):
+            results[name] = func()
+    return results
+
+
+def generate_statistical_report(csv_path: str = "/tmp/data.csv", streaming: bool = False,
+                                use_cache: bool = True, workers: int = None,
+                                backend: str = 'csv', database_url: str = None,
+                                tracer: Tracer = None, encoding: str = None):
     """
     Generate complete statistical report
+    workers > 1 runs the analyses in parallel, see compute_analyses().
+    backend='sql' computes the tables in PostgreSQL from data.austrian_employment
+    instead of loading csv_path (see sql_backend.py).
+    Loading and every analysis are recorded as stages of `tracer`.
     """
+    tracer = tracer or Tracer()
     # Introduction
     print("=" * 80)
     print("AUSTRIAN EMPLOYMENT DATA - STATISTICAL ANALYSIS")
@@ -215,16 +693,31 @@ This administrative data is used for labor market monitoring, resource planning,
 and policy evaluation across Austria's regional employment offices.
 """)
 
-    print("📊 Loading data...")
-    df = load_data(csv_path)
-    print(f"✅ Loaded {len(df):,} rows, {len(df.columns)} columns")
-    print(f"📅 Date range: {df['Datum'].min()} to {df['Datum'].max()}\n")
+    if backend == 'sql':
+        from sqlalchemy import create_engine
+        from sql_backend import DATABASE_URL, TABLE, compute_analyses_sql
+
+        print(f"📊 Aggregating {TABLE} in the database...")
+        with tracer.stage('sql_analyses'):
+            results = compute_analyses_sql(create_engine(database_url or DATABASE_URL))
+        summary = results['summary']
+    else:
+        print("📊 Loading data...")
+        with tracer.stage('load_data') as stage:
+            df = load_data(csv_path, streaming=streaming, use_cache=use_cache, tracer=tracer,
+                           encoding=encoding)
+            stage.rows = len(df)
+        results = compute_analyses(df, csv_path if use_cache else None, streaming, workers, tracer)
+        summary = {'rows': len(df), 'columns': len(df.columns),
+                   'date_from': df['Datum'].min(), 'date_to': df['Datum'].max()}
+    print(f"✅ Loaded {summary['rows']:,} rows, {summary['columns']} columns")
+    print(f"📅 Date range: {summary['date_from']} to {summary['date_to']}\n")
 
     # Univariate statistics
     print("=" * 80)
     print("UNIVARIATE STATISTICS - Numeric Variables")
     print("=" * 80)
-    univar_stats = univariate_statistics(df)
+    univar_stats = results['univariate']
     print(univar_stats.to_string(index=False))
     print()
 
@@ -232,7 +725,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("CATEGORICAL DISTRIBUTIONS")
     print("=" * 80)
-    cat_stats = categorical_statistics(df)
+    cat_stats = results['categorical']
 
     for var_name, freq_table in cat_stats.items():
         print(f"\n{var_name}:")
@@ -243,7 +736,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("CORRELATION MATRIX - Numeric Variables")
     print("=" * 80)
-    corr = bivariate_correlation(df)
+    corr = results['correlation']
     print(corr)
     print()
 
@@ -251,7 +744,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("BIVARIATE ANALYSIS - By Gender")
     print("=" * 80)
-    gender_stats = gender_analysis(df)
+    gender_stats = results['gender']
     print(gender_stats.to_string(index=False))
     print()
 
@@ -259,7 +752,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("BIVARIATE ANALYSIS - Top Education Levels")
     print("=" * 80)
-    edu_stats = education_analysis(df)
+    edu_stats = results['education']
     print(edu_stats.to_string(index=False))
     print()
 
@@ -267,7 +760,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("BIVARIATE ANALYSIS - By Region")
     print("=" * 80)
-    regional_stats = regional_analysis(df)
+    regional_stats = results['regional']
     print(regional_stats.to_string(index=False))
     print()
 
@@ -275,7 +768,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("TEMPORAL ANALYSIS - Trends Over Time")
     print("=" * 80)
-    temporal_stats = temporal_analysis(df)
+    temporal_stats = results['temporal']
     print(temporal_stats.head(12).to_string(index=False))
     print()
 
@@ -283,9 +776,7 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("CROSS-TABULATION - Gender x Education (Top 5)")
     print("=" * 80)
-    top_edu = df.groupby('HoeAbgAusbildung')['BESTAND'].sum().nlargest(5).index
-    df_top = df[df['HoeAbgAusbildung'].isin(top_edu)]
-    crosstab = cross_tabulation(df_top, 'Geschlecht', 'HoeAbgAusbildung')
+    crosstab = results['crosstab']
     print(crosstab)
     print()
 
@@ -293,13 +784,14 @@ and policy evaluation across Austria's regional employment offices.
     print("=" * 80)
     print("KEY INSIGHTS")
     print("=" * 80)
-    print(f"• Total employment (BESTAND): {df['BESTAND'].sum():,}")
-    print(f"• Total inflow (ZUGANG): {df['ZUGANG'].sum():,}")
-    print(f"• Total outflow (ABGANG): {df['ABGANG'].sum():,}")
-    print(f"• Net change: {df['ZUGANG'].sum() - df['ABGANG'].sum():,}")
-    print(f"• Gender split: {df.groupby('Geschlecht')['BESTAND'].sum().to_dict()}")
-    print(f"• Number of regions: {df['RGSName'].nunique()}")
-    print(f"• Number of education levels: {df['HoeAbgAusbildung'].nunique()}")
+    insights = results['insights']
+    print(f"• Total employment (BESTAND): {insights['BESTAND']:,}")
+    print(f"• Total inflow (ZUGANG): {insights['ZUGANG']:,}")
+    print(f"• Total outflow (ABGANG): {insights['ABGANG']:,}")
+    print(f"• Net change: {insights['ZUGANG'] - insights['ABGANG']:,}")
+    print(f"• Gender split: {insights['gender_split']}")
+    print(f"• Number of regions: {insights['regions']}")
+    print(f"• Number of education levels: {insights['education_levels']}")
     top_edu_level = edu_stats.iloc[0]['HoeAbgAusbildung']
     top_edu_count = edu_stats.iloc[0]['BESTAND_sum']
     print(f"• Top education level: {top_edu_level} ({top_edu_count:,.0f}, {edu_stats.iloc[0]['Pct_of_Total']:.1f}%)")
@@ -317,12 +809,53 @@ and policy evaluation across Austria's regional employment offices.
 
 if __name__ == "__main__":
     import sys
-
-    csv_file = sys.argv[1] if len(sys.argv) > 1 else "/tmp/data.csv"
+    import argparse
+    import instrumentation
+
+    parser = argparse.ArgumentParser(description="Statistical report for the AMS employment data")
+    parser.add_argument('csv_file', nargs='?', default="/tmp/data.csv")
+    parser.add_argument('--streaming', action='store_true',
+                        help="Load in bounded chunks with a compact fixed schema")
+    parser.add_argument('--no-cache', action='store_true', help="Bypass the Arrow cache")
+    parser.add_argument('--encoding', default=None, help="CSV encoding (default: detected)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Run the analyses in a pool of N processes")
+    parser.add_argument('--backend', choices=['csv', 'sql'], default='csv',
+                        help="sql: aggregate data.austrian_employment in PostgreSQL, "
+                             "fetching only the result tables")
+    parser.add_argument('--database-url', default=None, help="Database for --backend sql and --publish")
+    parser.add_argument('--publish', action='store_true',
+                        help="Write the report tables to data.stats_* (see publish_stats.py)")
+    parser.add_argument('--sketch', action='store_true',
+                        help="Constant-memory mode: univariate and categorical tables only, "
+                             "from mergeable streaming accumulators (see streaming_stats.py)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+    csv_file = args.csv_file
 
     try:
-        stats = generate_statistical_report(csv_file)
+        if args.sketch:
+            from streaming_stats import streaming_statistics, print_streaming_report
+            print_streaming_report(streaming_statistics(csv_file, args.encoding, workers=args.workers))
+            sys.exit(0)
+
+        tracer = Tracer('report', args.profile, args.trace_malloc)
+        stats = generate_statistical_report(csv_file, streaming=args.streaming,
+                                            use_cache=not args.no_cache, workers=args.workers,
+                                            backend=args.backend, database_url=args.database_url,
+                                            tracer=tracer, encoding=args.encoding)
         print("\n✅ Statistical analysis complete!")
+        if args.publish:
+            from sqlalchemy import create_engine
+            from publish_stats import publish_stats
+            from sql_backend import DATABASE_URL
+            with tracer.stage('publish_stats'):
+                version = publish_stats(create_engine(args.database_url or DATABASE_URL), stats)
+            print(f"📤 Published report tables as version {version}")
+        if args.trace or args.prometheus or args.profile or args.trace_malloc:
+            print()
+            tracer.print_summary()
+            tracer.export(args.trace, args.prometheus)
         print("\n💡 Tip: Use these statistics to create Superset charts:")
         print("   - Summary statistics table")
         print("   - Distribution histograms")
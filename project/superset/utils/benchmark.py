@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Ingest and Analysis
+
+Times the analysis pipeline of analyze_data.py and the ingest of
+create_sample_dashboard.py on synthetic data (generate_data.py) at several
+scales, and compares the timings with a stored JSON baseline:
+
+  • load_data (parse, streaming, Arrow cache hit)
+  • every analysis function and generate_statistical_report
+  • upload_csv_data per ingest method (needs a PostgreSQL server)
+
+It also checks that the streaming and the default loader print the same
+report, and (with --database-url) that the month checksums of incremental
+ingest agree between the CSV scan and PostgreSQL on a CSV with empty fields.
+Any difference fails the run like a regression.
+
+Each step is run --repeat times and the best time is kept. A step counts as
+a regression when it is more than --tolerance slower than the baseline (and
+slower by at least MIN_REGRESSION_SECONDS, to ignore noise on tiny steps).
+
+Usage:
+    python benchmark.py --rows 10000 100000 --save-baseline
+    python benchmark.py --rows 10000 100000                 # exit code 1 on regressions
+    python benchmark.py --database-url postgresql+psycopg2://user:pw@localhost/db
+"""
+
+import io
+import os
+import sys
+import json
+import difflib
+import time
+import platform
+import argparse
+import contextlib
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import analyze_data
+from generate_data import generate_csv
+
+BENCHMARK_DIR = os.environ.get('BENCHMARK_DIR', '/tmp/benchmarks')
+DEFAULT_BASELINE = str(Path(BENCHMARK_DIR) / 'baseline.json')
+DEFAULT_SCALES = [10_000, 100_000, 1_000_000]
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_SECONDS = 0.05
+CHECKSUM_ROWS = 5_000
+
+# Analysis steps: name -> function of (df, cube)
+ANALYSIS_STEPS = {
+    'univariate_statistics': lambda df, cube: analyze_data.univariate_statistics(df),
+    'categorical_statistics': lambda df, cube: analyze_data.categorical_statistics(df),
+    'bivariate_correlation': lambda df, cube: analyze_data.bivariate_correlation(df),
+    'build_cube': lambda df, cube: analyze_data.build_cube(df),
+    'gender_analysis': lambda df, cube: analyze_data.gender_analysis(df, cube),
+    'education_analysis': lambda df, cube: analyze_data.education_analysis(df, cube),
+    'regional_analysis': lambda df, cube: analyze_data.regional_analysis(df, cube),
+    'temporal_analysis': lambda df, cube: analyze_data.temporal_analysis(df, cube),
+    'top_education_crosstab': lambda df, cube: analyze_data.top_education_crosstab(cube),
+}
+
+
+def _timed(func, repeat: int = 1):
+    """Best wall time of `repeat` runs (stdout silenced) and the last result."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def dataset(rows: int, encoding: str = 'utf-8', seed: int = 0) -> str:
+    """Path of the synthetic CSV for this scale, generated on first use."""
+    path = Path(BENCHMARK_DIR) / f"ams_{rows}_{encoding}_{seed}.csv"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        print(f"   🧪 Generating {rows:,} rows -> {path}")
+        generate_csv(str(path), rows, encoding, seed)
+    return str(path)
+
+
+def bench_analysis(csv_path: str, repeat: int, encoding: str = None) -> dict:
+    """Timings of loading, each analysis and the full report."""
+    timings = {}
+    cache = analyze_data._cache_path(csv_path, False)
+
+    timings['load_data'], df = _timed(
+        lambda: analyze_data.load_data(csv_path, use_cache=False, encoding=encoding), repeat)
+    timings['load_data_streaming'], _ = _timed(
+        lambda: analyze_data.load_data(csv_path, streaming=True, use_cache=False, encoding=encoding), repeat)
+    if analyze_data.pa is not None:
+        cache.unlink(missing_ok=True)
+        analyze_data.load_data(csv_path, encoding=encoding)  # writes the cache
+        timings['load_data_cached'], _ = _timed(lambda: analyze_data.load_data(csv_path), repeat)
+
+    cube = analyze_data.build_cube(df)
+    for name, step in ANALYSIS_STEPS.items():
+        timings[name], _ = _timed(lambda: step(df, cube), repeat)
+
+    timings['generate_statistical_report'], _ = _timed(
+        lambda: analyze_data.generate_statistical_report(csv_path, use_cache=False, encoding=encoding), repeat)
+    return timings
+
+
+def report_text(csv_path: str, streaming: bool, encoding: str = None) -> str:
+    """Printed statistical report of one load mode."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        analyze_data.generate_statistical_report(csv_path, streaming=streaming, use_cache=False,
+                                                 encoding=encoding)
+    return output.getvalue()
+
+
+def check_report_modes(csv_path: str, encoding: str = None) -> list:
+    """Unified diff between the default and the streaming report (empty if identical)."""
+    return list(difflib.unified_diff(
+        report_text(csv_path, False, encoding).splitlines(),
+        report_text(csv_path, True, encoding).splitlines(),
+        'default', 'streaming', lineterm='', n=1))
+
+
+def nullable_dataset(rows: int, encoding: str = 'utf-8', seed: int = 0) -> str:
+    """Synthetic CSV with empty fields in every column but Datum (COPY loads them as NULL)."""
+    path = Path(BENCHMARK_DIR) / f"ams_{rows}_{encoding}_{seed}_nulls.csv"
+    if not path.exists():
+        df = pd.read_csv(dataset(rows, encoding, seed), sep=';', dtype=object,
+                         keep_default_na=False, encoding=encoding)
+        for i, col in enumerate(df.columns.drop('Datum')):
+            df.loc[df.index % 7 == i, col] = ''
+        df.to_csv(path, sep=';', index=False, encoding=encoding, lineterminator='\n')
+    return str(path)
+
+
+def check_checksums(encoding: str = 'utf-8') -> list:
+    """Months whose CSV scan and SQL checksum differ (see check_month_checksums)."""
+    from sqlalchemy import create_engine
+    from create_sample_dashboard import DATABASE_URL, check_month_checksums
+
+    return check_month_checksums(create_engine(DATABASE_URL), nullable_dataset(CHECKSUM_ROWS, encoding),
+                                 encoding)
+
+
+def bench_ingest(csv_path: str, methods: list, repeat: int) -> dict:
+    """Timings of upload_csv_data per method against the configured database."""
+    from create_sample_dashboard import upload_csv_data
+
+    timings = {}
+    for method in methods:
+        seconds, ok = _timed(lambda: upload_csv_data(method=method, csv_path=csv_path), repeat)
+        if not ok:
+            raise RuntimeError(f"upload_csv_data(method='{method}') failed")
+        timings[f'upload_csv_data_{method}'] = seconds
+    return timings
+
+
+def run_benchmarks(scales: list, repeat: int = 3, encoding: str = 'utf-8',
+                   ingest_methods: list = None) -> dict:
+    """Run the suite at every scale; ingest steps only if `ingest_methods` is given."""
+    results, mismatches = {}, {}
+    for rows in scales:
+        print(f"⏱️  {rows:,} rows")
+        csv_path = dataset(rows, encoding)
+        timings = bench_analysis(csv_path, repeat, encoding)
+        diff = check_report_modes(csv_path, encoding)
+        if diff:
+            mismatches[str(rows)] = diff
+        if ingest_methods:
+            timings.update(bench_ingest(csv_path, ingest_methods, repeat))
+        results[str(rows)] = {name: round(seconds, 4) for name, seconds in timings.items()}
+
+    return {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'host': platform.node(),
+            'cpus': os.cpu_count(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'repeat': repeat,
+            'encoding': encoding,
+        },
+        'results': results,
+        'report_mismatches': mismatches,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """
+    (rows, step, baseline seconds, current seconds) for every regressed step.
+    Timings are only comparable on the same input encoding (cp1252 decodes
+    slower), so a baseline of another encoding raises ValueError.
+    """
+    encoding, base_encoding = current['meta']['encoding'], baseline['meta'].get('encoding', 'utf-8')
+    if encoding != base_encoding:
+        raise ValueError(f"Baseline was measured on {base_encoding} data, this run on {encoding} - "
+                         f"use a separate --baseline per encoding")
+    regressions = []
+    for rows, timings in current['results'].items():
+        for step, seconds in timings.items():
+            base = baseline['results'].get(rows, {}).get(step)
+            if base is None:
+                continue
+            if seconds > base * (1 + tolerance) and seconds - base >= MIN_REGRESSION_SECONDS:
+                regressions.append((rows, step, base, seconds))
+    return regressions
+
+
+def print_results(current: dict, baseline: dict = None):
+    for rows, timings in current['results'].items():
+        print(f"\n{int(rows):,} rows:")
+        for step, seconds in timings.items():
+            base = (baseline or {}).get('results', {}).get(rows, {}).get(step)
+            change = f"  ({(seconds / base - 1) * 100:+.0f}% vs baseline)" if base else ""
+            print(f"   {step:32s} {seconds:9.3f}s{change}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark ingest and analysis on synthetic data")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_SCALES, help="Scales to run")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per step, best time is kept")
+    parser.add_argument('--encoding', default='utf-8', choices=['utf-8', 'cp1252'])
+    parser.add_argument('--database-url', default=None,
+                        help="PostgreSQL for the upload_csv_data steps (skipped without it)")
+    parser.add_argument('--ingest-methods', nargs='+', default=['copy', 'incremental', 'pandas'],
+                        choices=['copy', 'incremental', 'partitioned', 'pandas'])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown before a step is flagged (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        # Read by create_sample_dashboard at import time
+        os.environ['ANALYTICS_DATABASE_URL'] = args.database_url
+
+    current = run_benchmarks(args.rows, args.repeat, args.encoding,
+                             args.ingest_methods if args.database_url else None)
+    if args.database_url:
+        current['checksum_mismatches'] = check_checksums(args.encoding)
+
+    output = Path(BENCHMARK_DIR) / f"run_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.write_text(json.dumps(current, indent=2))
+    print(f"\n💾 Results written to {output}")
+
+    mismatches = current['report_mismatches']
+    for rows, diff in mismatches.items():
+        print(f"\n❌ {int(rows):,} rows: streaming report differs from the default report:")
+        print('\n'.join(diff[:40]))
+    checksum_mismatches = current.get('checksum_mismatches', [])
+    if checksum_mismatches:
+        print(f"\n❌ {len(checksum_mismatches)} month(s) where the CSV and the SQL checksum differ:")
+        for month, csv_state, table_state in checksum_mismatches:
+            print(f"   {month}  csv {csv_state}  table {table_state}")
+    failed = bool(mismatches or checksum_mismatches)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(current, indent=2))
+        print_results(current)
+        print(f"\n✅ Baseline saved to {baseline_path}")
+        sys.exit(1 if failed else 0)
+
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+    if baseline is None:
+        print_results(current)
+        print(f"\n⚠️  No baseline at {baseline_path} - run with --save-baseline first")
+        sys.exit(1 if failed else 0)
+
+    try:
+        regressions = compare(current, baseline, args.tolerance)
+    except ValueError as e:
+        print_results(current)
+        print(f"\n❌ {e}")
+        sys.exit(1)
+    print_results(current, baseline)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for rows, step, base, seconds in regressions:
+            print(f"   {int(rows):,} rows  {step}: {base:.3f}s -> {seconds:.3f}s")
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%} (baseline from {baseline['meta']['date']})")
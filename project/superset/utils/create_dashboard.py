@@ -6,21 +6,268 @@ This script demonstrates how to create dashboards via Superset API.
 Usage: python create_dashboard.py
 """
 
-import requests
+import sys
+import time
 import json
+import base64
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
+# HTTP client defaults - (connect, read) timeout in seconds, retry budget and
+# the base of the exponential backoff (0.5s, 1s, 2s, ... plus jitter)
+DEFAULT_TIMEOUT = (5, 60)
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30
+POOL_SIZE = 20
+
+# Transient statuses worth retrying. POST is not idempotent, so it is only
+# retried when the server rejected the request before processing it.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_STATUSES_POST = {429, 503}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 30
+
+# Requests in flight during bulk provisioning (keep <= POOL_SIZE)
+DEFAULT_CONCURRENCY = 8
+
+# Metadata lookups: rows per list page and lifetime of cached name -> id entries
+PAGE_SIZE = 100
+LOOKUP_TTL = 300
+
+# Name column of each resource for lookups
+NAME_COLUMNS = {
+    'database': 'database_name',
+    'dataset': 'table_name',
+    'chart': 'slice_name',
+    'dashboard': 'dashboard_title',
+}
+
+_RISON_ID_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_./~-')
+
+
+def rison(value) -> str:
+    """Encode a value as Rison, the query format of the Superset list API (`?q=`)."""
+    if value is True:
+        return '!t'
+    if value is False:
+        return '!f'
+    if value is None:
+        return '!n'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, dict):
+        return '(' + ','.join(f"{rison(str(k))}:{rison(v)}" for k, v in value.items()) + ')'
+    if isinstance(value, (list, tuple)):
+        return '!(' + ','.join(rison(v) for v in value) + ')'
+    value = str(value)
+    if value and set(value) <= _RISON_ID_CHARS and not value[0].isdigit() and value[0] != '-':
+        return value
+    return "'" + value.replace('!', '!!').replace("'", "!'") + "'"
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float = LOOKUP_TTL):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                self._data.pop(key, None)
+                return None
+            return entry[0]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+# Viz types whose queries are grouped on a time x-axis
+TIMESERIES_VIZ_TYPES = {'echarts_timeseries_line', 'echarts_timeseries_bar', 'echarts_area'}
+
+# Operators of SIMPLE adhoc filters -> query filter operators
+FILTER_OPERATORS = {'==': '==', '!=': '!=', 'IN': 'IN', 'NOT IN': 'NOT IN',
+                    '>': '>', '<': '<', '>=': '>=', '<=': '<='}
+
+
+def query_context(viz_type: str, params, dataset_id: int) -> str:
+    """
+    Query context of a chart, built from its params the way the frontend's
+    buildQuery does for the viz types of this repo. Stored with the chart, it
+    lets /api/v1/chart/<id>/data/ run the chart's query (used by warm_cache.py);
+    saving the chart in Explore replaces it with the frontend's own.
+    """
+    params = json.loads(params) if isinstance(params, str) else dict(params)
+    metrics = params.get('metrics') or ([params['metric']] if params.get('metric') else [])
+    groupby = list(params.get('groupby') or [])
+
+    columns = list(groupby)
+    x_axis = (params.get('x_axis') or params.get('time_column')) if viz_type in TIMESERIES_VIZ_TYPES else None
+    if x_axis:
+        columns.insert(0, {'timeGrain': params.get('time_grain_sqla', 'P1D'), 'columnType': 'BASE_AXIS',
+                           'sqlExpression': x_axis, 'label': x_axis, 'expressionType': 'SQL'})
+
+    filters = [{'col': f['subject'], 'op': FILTER_OPERATORS[f['operator']], 'val': f['comparator']}
+               for f in params.get('adhoc_filters', [])
+               if f.get('expressionType') == 'SIMPLE' and f.get('operator') in FILTER_OPERATORS]
+
+    query = {
+        'filters': filters,
+        'extras': {'having': '', 'where': ''},
+        'applied_time_extras': {},
+        'columns': columns,
+        'metrics': metrics,
+        'orderby': [[metrics[0], False]] if metrics and (groupby or params.get('sort_by_metric')) else [],
+        'annotation_layers': [],
+        'series_columns': groupby if x_axis else [],
+        'series_limit': 0,
+        'order_desc': True,
+        'time_range': params.get('time_range', 'No filter'),
+        'url_params': {},
+        'custom_params': {},
+        'custom_form_data': {},
+    }
+    if columns:
+        query['row_limit'] = params.get('row_limit', 10000)
+    return json.dumps({
+        'datasource': {'id': dataset_id, 'type': 'table'},
+        'force': False,
+        'queries': [query],
+        'form_data': {**params, 'viz_type': viz_type, 'datasource': f"{dataset_id}__table"},
+        'result_format': 'json',
+        'result_type': 'full',
+    }, sort_keys=True)
+
+
+def _token_expiry(token: str) -> float:
+    """`exp` claim of a JWT (0 if it can't be read)."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims.get('exp', 0))
+    except (IndexError, ValueError):
+        return 0
+
 
 class SupersetAPI:
-    def __init__(self, base_url: str = "http://localhost:8088"):
+    def __init__(self, base_url: str = "http://localhost:8088", timeout=DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 pool_size: int = POOL_SIZE, cache: TTLCache = None):
         self.base_url = base_url
+        # name -> id lookups, shareable between clients of one provisioning run
+        self.cache = cache if cache is not None else TTLCache()
         self.access_token = None
-        self.headers = {"Content-Type": "application/json"}
+        self.refresh_token = None
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._credentials = None
+        self._token_expires = 0
+        self._token_lock = threading.Lock()
+
+        # One keep-alive session for all calls; retries are handled in _request()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.headers = self.session.headers
+        self.headers.update({"Content-Type": "application/json"})
+
+    def _backoff_delay(self, attempt: int, response=None) -> float:
+        """Retry-After if the server sent one, else exponential backoff with jitter."""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+        return min(self.backoff * 2 ** attempt, MAX_BACKOFF) * random.uniform(0.5, 1.0)
+
+    def _request(self, method: str, path: str, auth: bool = True, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session.
+
+        Retries connection errors, timeouts (idempotent methods only) and
+        RETRY_STATUSES with exponential backoff. The access token is refreshed
+        shortly before it expires and once more if the server answers 401.
+        """
+        method = method.upper()
+        retry_statuses = RETRY_STATUSES if method in IDEMPOTENT_METHODS else RETRY_STATUSES_POST
+        kwargs.setdefault('timeout', self.timeout)
+        refreshed = False
+
+        for attempt in range(self.max_retries + 1):
+            if auth and self.refresh_token and self._token_expires:
+                self._refresh_access_token()
+            token = self.access_token
+            try:
+                response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A read timeout may mean the server did process a POST
+                retryable = method in IDEMPOTENT_METHODS or not isinstance(e, requests.ReadTimeout)
+                if not retryable or attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                continue
+
+            if response.status_code == 401 and auth and not refreshed and self._credentials:
+                # Token expired or revoked - refresh and repeat right away
+                refreshed = True
+                self._refresh_access_token(force=True, stale_token=token)
+                continue
+
+            if response.status_code in retry_statuses and attempt < self.max_retries:
+                time.sleep(self._backoff_delay(attempt, response))
+                continue
+            return response
+
+        return response
+
+    def _set_tokens(self, access_token: str, refresh_token: str = None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token or self.refresh_token
+        self._token_expires = _token_expiry(access_token)
+        self.headers["Authorization"] = f"Bearer {self.access_token}"
 
-    def login(self, username: str = "admin", password: str = "admin"):
-        """Authenticate and get access token"""
-        response = requests.post(
-            f"{self.base_url}/api/v1/security/login",
+    def _refresh_access_token(self, force: bool = False, stale_token: str = None):
+        """
+        Get a new access token with the refresh token, or log in again if that
+        fails. Thread-safe: concurrent callers refresh only once.
+        """
+        with self._token_lock:
+            if stale_token is not None and self.access_token != stale_token:
+                return  # another thread already refreshed
+            if not force and time.time() <= self._token_expires - TOKEN_REFRESH_MARGIN:
+                return
+            response = self._request(
+                'POST', "/api/v1/security/refresh", auth=False,
+                headers={"Authorization": f"Bearer {self.refresh_token}"}
+            ) if self.refresh_token else None
+            if response is not None and response.ok:
+                self._set_tokens(response.json()["access_token"])
+            else:
+                self.login(*self._credentials, quiet=True)
+
+    def login(self, username: str = "admin", password: str = "admin", quiet: bool = False):
+        """Authenticate and get access and refresh tokens"""
+        response = self._request(
+            'POST', "/api/v1/security/login", auth=False,
             json={
                 "username": username,
                 "password": password,
@@ -29,92 +276,163 @@ class SupersetAPI:
             }
         )
         response.raise_for_status()
-        self.access_token = response.json()["access_token"]
-        self.headers["Authorization"] = f"Bearer {self.access_token}"
-        print(f"✅ Logged in as {username}")
+        tokens = response.json()
+        self._credentials = (username, password)
+        self._set_tokens(tokens["access_token"], tokens.get("refresh_token"))
+        if not quiet:
+            print(f"✅ Logged in as {username}")
+
+    def list_objects(self, resource: str, filters: list = None, columns: list = None,
+                     page_size: int = PAGE_SIZE):
+        """
+        Yield all objects of a resource ('database', 'dataset', 'chart',
+        'dashboard') matching the server-side `filters`, e.g.
+        [{'col': 'slice_name', 'opr': 'eq', 'value': 'Total Employment'}],
+        page by page.
+        """
+        page = 0
+        while True:
+            query = {'filters': filters or [], 'page': page, 'page_size': page_size}
+            if columns:
+                query['columns'] = columns
+            response = self._request('GET', f"/api/v1/{resource}/", params={'q': rison(query)})
+            response.raise_for_status()
+            body = response.json()
+            yield from body["result"]
+
+            page += 1
+            if not body["result"] or page * page_size >= body.get("count", 0):
+                return
+
+    @staticmethod
+    def _lookup_key(resource: str, name: str, filters: list = None, ignore_case: bool = False) -> tuple:
+        return resource, name.lower() if ignore_case else name, rison(filters or [])
+
+    def lookup(self, resource: str, name: str, filters: list = None, ignore_case: bool = False) -> int:
+        """
+        Id of the object of `resource` named `name` (None if there is none).
+
+        The name is matched server-side, so only matching rows are transferred;
+        results are kept in the TTL cache shared by this provisioning run.
+        """
+        name_col = NAME_COLUMNS[resource]
+        key = self._lookup_key(resource, name, filters, ignore_case)
+        object_id = self.cache.get(key)
+        if object_id is not None:
+            return object_id
+
+        # 'ct' is a case-insensitive contains - narrowed to equality below
+        name_filter = {'col': name_col, 'opr': 'ct' if ignore_case else 'eq', 'value': name}
+        for obj in self.list_objects(resource, [name_filter] + (filters or []), ['id', name_col]):
+            if obj[name_col] == name or (ignore_case and obj[name_col].lower() == name.lower()):
+                self.cache.set(key, obj["id"])
+                return obj["id"]
+        return None
 
     def get_database_id(self, database_name: str = "examples") -> int:
-        """Get database ID by name"""
-        response = requests.get(
-            f"{self.base_url}/api/v1/database/",
-            headers=self.headers
-        )
-        response.raise_for_status()
-        databases = response.json()["result"]
+        """Get database ID by name (case-insensitive)"""
+        database_id = self.lookup('database', database_name, ignore_case=True)
+        if database_id is None:
+            raise ValueError(f"Database '{database_name}' not found")
+        return database_id
 
-        for db in databases:
-            if db["database_name"].lower() == database_name.lower():
-                return db["id"]
+    @staticmethod
+    def _dataset_filters(database_id: int) -> list:
+        return [{'col': 'database', 'opr': 'rel_o_m', 'value': database_id}]
 
-        raise ValueError(f"Database '{database_name}' not found")
+    def get_dataset_id(self, database_id: int, table_name: str) -> int:
+        """Id of the dataset for `table_name` in the database (None if missing)"""
+        return self.lookup('dataset', table_name, self._dataset_filters(database_id))
+
+    def get_chart_id(self, slice_name: str) -> int:
+        """Id of the chart named `slice_name` (None if missing)"""
+        return self.lookup('chart', slice_name)
+
+    def get_dashboard_id(self, dashboard_title: str) -> int:
+        """Id of the dashboard titled `dashboard_title` (None if missing)"""
+        return self.lookup('dashboard', dashboard_title)
 
     def create_dataset(self, database_id: int, table_name: str) -> int:
-        """Create a dataset from a table"""
+        """Create a dataset from a table, or return the existing one"""
+        dataset_id = self.get_dataset_id(database_id, table_name)
+        if dataset_id is not None:
+            print(f"✅ Found existing dataset: {table_name} (ID: {dataset_id})")
+            return dataset_id
+
         payload = {
             "database": database_id,
             "schema": "",
             "table_name": table_name
         }
 
-        response = requests.post(
-            f"{self.base_url}/api/v1/dataset/",
-            json=payload,
-            headers=self.headers
-        )
+        response = self._request('POST', "/api/v1/dataset/", json=payload)
 
         if response.status_code == 422:
-            # Dataset might already exist
-            print(f"⚠️  Dataset '{table_name}' might already exist")
-            # Try to find it
-            response = requests.get(
-                f"{self.base_url}/api/v1/dataset/?q=(filters:!((col:table_name,opr:eq,value:'{table_name}')))",
-                headers=self.headers
-            )
-            datasets = response.json()["result"]
-            if datasets:
+            # Created concurrently since the lookup
+            dataset_id = self.get_dataset_id(database_id, table_name)
+            if dataset_id is not None:
                 print(f"✅ Found existing dataset: {table_name}")
-                return datasets[0]["id"]
+                return dataset_id
             raise Exception("Could not create or find dataset")
 
         response.raise_for_status()
         dataset_id = response.json()["id"]
+        self.cache.set(self._lookup_key('dataset', table_name, self._dataset_filters(database_id)), dataset_id)
         print(f"✅ Created dataset: {table_name} (ID: {dataset_id})")
         return dataset_id
 
     def create_chart(self, dataset_id: int, chart_config: Dict[str, Any]) -> int:
-        """Create a chart"""
+        """Create a chart (with a query context built from its params unless one is given)"""
         payload = {
             "datasource_id": dataset_id,
             "datasource_type": "table",
+            "query_context": query_context(chart_config['viz_type'], chart_config.get('params', {}), dataset_id),
             **chart_config
         }
 
-        response = requests.post(
-            f"{self.base_url}/api/v1/chart/",
-            json=payload,
-            headers=self.headers
-        )
+        response = self._request('POST', "/api/v1/chart/", json=payload)
         response.raise_for_status()
         chart_id = response.json()["id"]
+        self.cache.set(self._lookup_key('chart', chart_config['slice_name']), chart_id)
         print(f"✅ Created chart: {chart_config['slice_name']} (ID: {chart_id})")
         return chart_id
 
-    def create_dashboard(self, title: str, chart_ids: list) -> int:
-        """Create a dashboard with charts"""
-        payload = {
+    def update_chart(self, chart_id: int, chart_config: Dict[str, Any], dataset_id: int = None) -> int:
+        """Update a chart in place (and rebuild its query context if the dataset is given)"""
+        payload = dict(chart_config)
+        if dataset_id is not None:
+            payload.update({"datasource_id": dataset_id, "datasource_type": "table"})
+            payload.setdefault("query_context",
+                               query_context(chart_config['viz_type'], chart_config.get('params', {}), dataset_id))
+
+        response = self._request('PUT', f"/api/v1/chart/{chart_id}", json=payload)
+        response.raise_for_status()
+        print(f"✏️  Updated chart: {chart_config['slice_name']} (ID: {chart_id})")
+        return chart_id
+
+    def delete_chart(self, chart_id: int):
+        """Delete a chart"""
+        response = self._request('DELETE', f"/api/v1/chart/{chart_id}")
+        response.raise_for_status()
+        self.cache.invalidate()
+        print(f"🗑️  Deleted chart {chart_id}")
+
+    def _dashboard_payload(self, title: str, chart_ids: list, slug: str = None) -> dict:
+        return {
             "dashboard_title": title,
-            "slug": title.lower().replace(" ", "-"),
+            "slug": slug or title.lower().replace(" ", "-"),
             "published": True,
             "position_json": self._generate_position_json(chart_ids)
         }
 
-        response = requests.post(
-            f"{self.base_url}/api/v1/dashboard/",
-            json=payload,
-            headers=self.headers
-        )
+    def create_dashboard(self, title: str, chart_ids: list, slug: str = None) -> int:
+        """Create a dashboard with charts"""
+        payload = self._dashboard_payload(title, chart_ids, slug)
+
+        response = self._request('POST', "/api/v1/dashboard/", json=payload)
         response.raise_for_status()
         dashboard_id = response.json()["id"]
+        self.cache.set(self._lookup_key('dashboard', title), dashboard_id)
         print(f"✅ Created dashboard: {title} (ID: {dashboard_id})")
 
         # Add charts to dashboard
@@ -123,6 +441,75 @@ class SupersetAPI:
 
         return dashboard_id
 
+    def update_dashboard(self, dashboard_id: int, title: str, chart_ids: list, slug: str = None) -> int:
+        """Update a dashboard's title, slug and layout in place"""
+        payload = self._dashboard_payload(title, chart_ids, slug)
+
+        response = self._request('PUT', f"/api/v1/dashboard/{dashboard_id}", json=payload)
+        response.raise_for_status()
+        print(f"✏️  Updated dashboard: {title} (ID: {dashboard_id})")
+        return dashboard_id
+
+    def delete_dashboard(self, dashboard_id: int):
+        """Delete a dashboard"""
+        response = self._request('DELETE', f"/api/v1/dashboard/{dashboard_id}")
+        response.raise_for_status()
+        self.cache.invalidate()
+        print(f"🗑️  Deleted dashboard {dashboard_id}")
+
+    def create_charts(self, dataset_id: int, chart_configs: list,
+                      max_workers: int = DEFAULT_CONCURRENCY) -> tuple:
+        """
+        Create many charts concurrently, at most max_workers requests in flight.
+        A failing chart doesn't stop the batch: returns the ids of the created
+        charts (in input order) and {slice_name: error} for the failures.
+        """
+        result = self.provision_dashboards({None: chart_configs}, dataset_id, max_workers)[None]
+        return result['chart_ids'], result['failures']
+
+    def provision_dashboards(self, dashboards: dict, dataset_id: int,
+                             max_workers: int = DEFAULT_CONCURRENCY) -> dict:
+        """
+        Bulk-create dashboards: {title: [chart_config, ...]} -> per title
+        {'dashboard_id', 'chart_ids', 'failures'}.
+
+        The charts of all dashboards share one pool of max_workers threads;
+        each dashboard is then created with one call once its charts exist.
+        Failed charts are left out of their dashboard and reported in
+        'failures' ({slice_name: error}); a title of None creates charts only.
+        """
+        results = {title: {'dashboard_id': None, 'chart_ids': [None] * len(configs), 'failures': {}}
+                   for title, configs in dashboards.items()}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {}
+            for title, configs in dashboards.items():
+                for i, config in enumerate(configs):
+                    futures[pool.submit(self.create_chart, dataset_id, config)] = (title, i, config)
+            for future in as_completed(futures):
+                title, i, config = futures[future]
+                try:
+                    results[title]['chart_ids'][i] = future.result()
+                except Exception as e:
+                    results[title]['failures'][config['slice_name']] = str(e)
+                    print(f"❌ Failed to create chart '{config['slice_name']}': {e}")
+
+            for result in results.values():
+                result['chart_ids'] = [chart_id for chart_id in result['chart_ids'] if chart_id is not None]
+
+            dashboard_futures = {pool.submit(self.create_dashboard, title, result['chart_ids']): title
+                                 for title, result in results.items()
+                                 if title is not None and result['chart_ids']}
+            for future in as_completed(dashboard_futures):
+                title = dashboard_futures[future]
+                try:
+                    results[title]['dashboard_id'] = future.result()
+                except Exception as e:
+                    results[title]['failures'][title] = str(e)
+                    print(f"❌ Failed to create dashboard '{title}': {e}")
+
+        return results
+
     def _generate_position_json(self, chart_ids: list) -> str:
         """Generate layout for dashboard charts"""
         # Simple 2-column layout
@@ -155,83 +542,113 @@ class SupersetAPI:
         pass
 
 
-def create_austrian_employment_dashboard():
+def employment_chart_configs(region: str = None) -> list:
     """
-    Create a sample dashboard for Austrian employment data
+    Chart definitions of the employment dashboard. With a region, every chart
+    is filtered to that RGS office and named after it.
     """
-
-    # Initialize API
-    api = SupersetAPI()
-    api.login()
-
-    # Get database
-    database_id = api.get_database_id("examples")
-
-    # Create dataset (assuming CSV was uploaded as 'austrian_employment')
-    table_name = "austrian_employment"
-    dataset_id = api.create_dataset(database_id, table_name)
-
-    # Define charts
     charts = [
         {
             "slice_name": "Employment Over Time by Gender",
             "viz_type": "echarts_timeseries_line",
-            "params": json.dumps({
+            "params": {
                 "time_column": "Datum",
                 "metrics": ["SUM(BESTAND)"],
                 "groupby": ["Geschlecht"],
                 "time_grain_sqla": "P1M",  # Monthly
                 "x_axis_time_format": "%Y-%m",
-            })
+            }
         },
         {
             "slice_name": "Education Level Distribution",
             "viz_type": "pie",
-            "params": json.dumps({
+            "params": {
                 "metrics": ["SUM(BESTAND)"],
                 "groupby": ["HoeAbgAusbildung"],
                 "row_limit": 10,
                 "sort_by_metric": True,
-            })
+            }
         },
         {
             "slice_name": "Regional Comparison",
             "viz_type": "echarts_timeseries_bar",
-            "params": json.dumps({
+            "params": {
                 "metrics": ["SUM(BESTAND)", "SUM(ZUGANG)", "SUM(ABGANG)"],
                 "groupby": ["RGSName"],
                 "row_limit": 15,
-            })
+            }
         },
         {
             "slice_name": "Total Employment",
             "viz_type": "big_number_total",
-            "params": json.dumps({
+            "params": {
                 "metric": "SUM(BESTAND)",
                 "time_column": "Datum",
-            })
+            }
         }
     ]
 
-    # Create charts
-    chart_ids = []
-    for chart_config in charts:
-        try:
-            chart_id = api.create_chart(dataset_id, chart_config)
-            chart_ids.append(chart_id)
-        except Exception as e:
-            print(f"❌ Failed to create chart '{chart_config['slice_name']}': {e}")
+    for chart in charts:
+        if region:
+            chart["slice_name"] = f"{chart['slice_name']} - {region}"
+            chart["params"]["adhoc_filters"] = [{
+                "expressionType": "SIMPLE",
+                "clause": "WHERE",
+                "subject": "RGSName",
+                "operator": "==",
+                "comparator": region,
+            }]
+        chart["params"] = json.dumps(chart["params"])
+    return charts
+
+
+def create_austrian_employment_dashboard(regions: list = None, max_workers: int = DEFAULT_CONCURRENCY):
+    """
+    Create a sample dashboard for Austrian employment data
+
+    With `regions`, one filtered dashboard per RGS office is created as well;
+    all charts are provisioned concurrently (max_workers requests in flight).
+    """
+
+    # Initialize API
+    api = SupersetAPI()
+    api.login()
+
+    # Get database
+    database_id = api.get_database_id("examples")
+
+    # Create dataset (assuming CSV was uploaded as 'austrian_employment')
+    table_name = "austrian_employment"
+    dataset_id = api.create_dataset(database_id, table_name)
 
-    # Create dashboard
-    dashboard_id = api.create_dashboard(
-        "Austrian Employment Analysis",
-        chart_ids
-    )
+    # Define dashboards and their charts
+    dashboards = {"Austrian Employment Analysis": employment_chart_configs()}
+    for region in regions or []:
+        dashboards[f"Austrian Employment - {region}"] = employment_chart_configs(region)
 
-    print(f"\n🎉 Dashboard created successfully!")
-    print(f"📊 View it at: http://localhost:8088/superset/dashboard/{dashboard_id}/")
+    # Create charts and dashboards
+    results = api.provision_dashboards(dashboards, dataset_id, max_workers)
+
+    failed = {title: result for title, result in results.items() if result['failures']}
+    created = [result['dashboard_id'] for result in results.values() if result['dashboard_id']]
+    print(f"\n🎉 Created {len(created)} of {len(dashboards)} dashboard(s)")
+    for title, result in results.items():
+        if result['dashboard_id']:
+            print(f"📊 {title}: http://localhost:8088/superset/dashboard/{result['dashboard_id']}/")
+    for title, result in failed.items():
+        print(f"⚠️  {title}: {len(result['failures'])} failure(s)")
+    return results
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the Austrian employment dashboard(s) via the Superset API")
+    parser.add_argument('--regions', nargs='+', metavar='RGSName', default=None,
+                        help="Also create one filtered dashboard per RGS office")
+    parser.add_argument('--workers', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Concurrent API requests (default {DEFAULT_CONCURRENCY})")
+    args = parser.parse_args()
+
     print("🚀 Creating Austrian Employment Dashboard...\n")
-    create_austrian_employment_dashboard()
+    results = create_austrian_employment_dashboard(args.regions, args.workers)
+    if any(result['failures'] for result in results.values()):
+        sys.exit(1)
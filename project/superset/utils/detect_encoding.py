@@ -7,7 +7,31 @@ Usage:
 """
 
 import sys
+import os
+import json
+import fcntl
+import codecs
+import hashlib
 import chardet
+from chardet.universaldetector import UniversalDetector
+
+# Detection verdicts are cached per file path (with the fingerprint of the
+# content they were made on), so re-runs skip the detector
+ENCODING_CACHE_PATH = os.environ.get('CSV_ENCODING_CACHE', '/tmp/csv_encoding_cache.json')
+
+# Block size for hashing and detection, and the most bytes fed to the detector
+DETECT_BLOCK_SIZE = 64 * 1024
+DETECT_MAX_BYTES = 8 * 1024 * 1024
+
+# chardet names -> codec used for reading. ASCII is valid UTF-8, and cp1252 is
+# the superset of ISO-8859-1 that Windows exports actually use
+ENCODING_ALIASES = {
+    'ascii': 'utf-8',
+    'utf-8-sig': 'utf-8',
+    'iso-8859-1': 'cp1252',
+    'latin-1': 'cp1252',
+    'windows-1252': 'cp1252',
+}
 
 def detect_file_encoding(file_path):
     """Detect the encoding of a file."""
@@ -17,6 +41,111 @@ def detect_file_encoding(file_path):
         result = chardet.detect(raw_data)
         return result
 
+def detect_file_encoding_incremental(file_path, max_bytes=DETECT_MAX_BYTES):
+    """
+    Detect the encoding by feeding blocks to chardet's incremental detector.
+    Stops as soon as the detector is confident, or after max_bytes.
+    """
+    detector = UniversalDetector()
+    fed = 0
+    with open(file_path, 'rb') as f:
+        while fed < max_bytes and not detector.done:
+            block = f.read(DETECT_BLOCK_SIZE)
+            if not block:
+                break
+            detector.feed(block)
+            fed += len(block)
+    detector.close()
+    return dict(detector.result, bytes_read=fed)
+
+def file_fingerprint(file_path):
+    """
+    Cache key for a file: its size, mtime and a hash of its first and last MB
+    (like analyze_data._cache_path), so a cache hit doesn't read the whole file.
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(1024 * 1024))
+        if stat.st_size > 2 * 1024 * 1024:
+            f.seek(-1024 * 1024, os.SEEK_END)
+            digest.update(f.read())
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{digest.hexdigest()}"
+
+def decodes_as_utf8(file_path, offset=0):
+    """True if the file decodes as UTF-8 from `offset` on (read in blocks)."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        try:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                decoder.decode(block)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _update_cache(cache_path, path, entry):
+    """
+    Store `entry` for `path`. The cache is re-read and replaced under an
+    exclusive lock, so concurrent runs don't drop each other's entries, and
+    entries of files that no longer exist are pruned.
+    """
+    with open(f"{cache_path}.lock", 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        cache = _load_cache(cache_path)
+        cache[path] = entry
+        cache = {p: e for p, e in cache.items() if os.path.exists(p)}
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_path)
+
+def resolve_encoding(file_path, cache_path=ENCODING_CACHE_PATH):
+    """
+    Return the codec to read file_path with, or None if it can't be detected.
+
+    The verdict is cached per path together with file_fingerprint(), so an
+    unchanged file is never run through the detector twice; a changed file
+    replaces its entry.
+
+    The detector sees at most DETECT_MAX_BYTES. A UTF-8 (or ASCII) verdict on
+    a longer file is checked against the rest of the file and falls back to
+    cp1252 when it doesn't decode - e.g. a Windows export whose first umlaut
+    comes after the sampled part.
+    """
+    path = os.path.abspath(file_path)
+    fingerprint = file_fingerprint(file_path)
+    entry = _load_cache(cache_path).get(path)
+    if entry and entry.get('fingerprint') == fingerprint:
+        return entry['encoding']
+
+    result = detect_file_encoding_incremental(file_path)
+    if not result['encoding']:
+        return None
+
+    encoding = ENCODING_ALIASES.get(result['encoding'].lower(), result['encoding'].lower())
+    if encoding == 'utf-8' and result['bytes_read'] < os.path.getsize(file_path) \
+            and not decodes_as_utf8(file_path, result['bytes_read']):
+        encoding = 'cp1252'
+    entry = {
+        'fingerprint': fingerprint,
+        'encoding': encoding,
+        'confidence': result['confidence'],
+    }
+    try:
+        _update_cache(cache_path, path, entry)
+    except OSError as e:
+        print(f"⚠️  Could not write encoding cache {cache_path}: {e}")
+    return encoding
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python detect_encoding.py <csv_file_path>")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Synthetic AMS Data Generator
+
+Writes CSV files shaped like the AMS extract (AL_Ausbildung_RGS.csv) at any
+scale, for benchmarks and load tests:
+
+  • RGS offices of all nine federal states (code = state digit + office number)
+  • The 18 education codes of DATA_DICTIONARY.md, weighted like the real data
+    (Lehre largest, Pflichtschule second, ...)
+  • Gender M/W, one row per office, gender and education level per month
+  • Consistent stock and flows: BESTAND(t) = BESTAND(t-1) + ZUGANG(t) - ABGANG(t),
+    with seasonal inflow
+
+Months run from January 2019 on. When a scale needs more than MAX_MONTHS
+months, numbered copies of the offices are added instead (e.g. "Graz 2",
+with a four-digit code), so 100M rows stay within realistic dates. The codes
+of a state run out at about 120M rows.
+
+Usage:
+    python generate_data.py /tmp/data.csv --rows 1000000 [--encoding cp1252] [--seed 0]
+"""
+
+import sys
+import math
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+# Offices per federal state (state digit -> names, numbered in this order)
+RGS_OFFICES = {
+    1: ['Eisenstadt', 'Mattersburg', 'Neusiedl am See', 'Oberpullendorf', 'Oberwart',
+        'Güssing', 'Jennersdorf'],
+    2: ['Klagenfurt', 'Villach', 'Spittal an der Drau', 'Wolfsberg', 'St. Veit an der Glan',
+        'Feldkirchen', 'Völkermarkt', 'Hermagor'],
+    3: ['St. Pölten', 'Wiener Neustadt', 'Baden', 'Mödling', 'Amstetten', 'Krems',
+        'Tulln', 'Mistelbach', 'Hollabrunn', 'Gänserndorf', 'Zwettl', 'Melk',
+        'Neunkirchen', 'Bruck an der Leitha', 'Korneuburg'],
+    4: ['Linz', 'Wels', 'Steyr', 'Braunau', 'Vöcklabruck', 'Gmunden', 'Ried im Innkreis',
+        'Freistadt', 'Perg', 'Kirchdorf', 'Rohrbach', 'Schärding', 'Grieskirchen', 'Traun'],
+    5: ['Salzburg', 'Hallein', 'Bischofshofen', 'Zell am See', 'Tamsweg'],
+    6: ['Graz Ost', 'Graz West und Umgebung', 'Leoben', 'Bruck an der Mur', 'Feldbach',
+        'Leibnitz', 'Weiz', 'Hartberg', 'Judenburg', 'Liezen', 'Deutschlandsberg', 'Voitsberg'],
+    7: ['Innsbruck', 'Kufstein', 'Schwaz', 'Lienz', 'Landeck', 'Imst', 'Kitzbühel',
+        'Reutte', 'Telfs'],
+    8: ['Bregenz', 'Dornbirn', 'Feldkirch', 'Bludenz', 'Bezau'],
+    9: ['Wien Dresdner Straße', 'Wien Esteplatz', 'Wien Hauffgasse', 'Wien Huttengasse',
+        'Wien Johnstraße', 'Wien Laxenburger Straße', 'Wien Prandaugasse', 'Wien Redergasse',
+        'Wien Schloßhofer Straße', 'Wien Wagramer Straße', 'Wien Währinger Gürtel', 'Wien Süd'],
+}
+
+# Education codes (DATA_DICTIONARY.md) with their share of the stock
+EDUCATION_LEVELS = {
+    'PO': ('Keine abgeschl. Pflichtschule', 0.04),
+    'PS': ('Pflichtschule', 0.30),
+    'LE': ('Lehre', 0.33),
+    'LM': ('Lehre u. Meisterprüfung', 0.01),
+    'LT': ('Teilintegrierte Lehre', 0.01),
+    'MK': ('Mittlere kaufm. Schule', 0.02),
+    'MS': ('Sonstige mittlere Schule', 0.02),
+    'MT': ('Mittlere techn.-gewerbl. Schule', 0.02),
+    'HA': ('Allg. höhere Schule', 0.05),
+    'HK': ('Höhere kaufm. Schule', 0.02),
+    'HS': ('Höhere sonstige Schule', 0.02),
+    'HT': ('Höhere techn.-gewerbl. Schule', 0.03),
+    'FB': ('Fachhochschule Bakkalaureat', 0.01),
+    'FH': ('Fachhochschule', 0.02),
+    'UB': ('Bakkalaureatstudium', 0.01),
+    'UV': ('Universität', 0.06),
+    'AK': ('Akademie', 0.01),
+    'XX': ('Ungeklärt', 0.02),
+}
+
+GENDER_SHARE = {'M': 0.55, 'W': 0.45}
+
+START_MONTH = '2019-01'
+MAX_MONTHS = 600
+
+# Average stock of an office (Wien offices are larger), monthly inflow rate
+# and its seasonal swing (peaks in winter and after the school year)
+OFFICE_STOCK = 2500
+WIEN_FACTOR = 4
+INFLOW_RATE = 0.18
+SEASONAL_AMPLITUDE = 0.25
+
+
+def _offices(count: int) -> list:
+    """
+    (code, name) for `count` offices, adding numbered copies beyond the real list.
+    Real offices keep their three-digit codes (state digit + office number);
+    copies are numbered on per state with four digits (state digit + 3), so
+    codes stay below 10000 and the state is always the leading digit.
+    """
+    copies = math.ceil(count / sum(map(len, RGS_OFFICES.values())))
+    largest = max(map(len, RGS_OFFICES.values()))
+    if copies * largest > 999:
+        raise ValueError(f"{count:,} offices exceed the four-digit office codes of a state")
+
+    offices = []
+    for copy in range(copies):
+        for state, names in RGS_OFFICES.items():
+            for i, name in enumerate(names):
+                if copy == 0:
+                    offices.append((state * 100 + i + 1, name))
+                else:
+                    # e.g. 1008 for the 2nd Eisenstadt
+                    offices.append((state * 1000 + copy * len(names) + i + 1, f"{name} {copy + 1}"))
+    return offices[:count]
+
+
+def _office_state(code: int) -> int:
+    return code // 1000 if code >= 1000 else code // 100
+
+
+def _layout(rows: int) -> tuple:
+    """Number of (offices, months) so that offices * 36 * months covers `rows`."""
+    per_office = 2 * len(EDUCATION_LEVELS)
+    real_offices = sum(map(len, RGS_OFFICES.values()))
+    months = math.ceil(rows / (real_offices * per_office))
+    if months <= MAX_MONTHS:
+        return real_offices, months
+    return math.ceil(rows / (MAX_MONTHS * per_office)), MAX_MONTHS
+
+
+def generate_months(rows: int, seed: int = 0):
+    """
+    Yield one DataFrame per month until `rows` rows have been produced
+    (the last month is cut short to hit the exact count).
+    """
+    rng = np.random.default_rng(seed)
+    n_offices, n_months = _layout(rows)
+    offices = _offices(n_offices)
+    codes = list(EDUCATION_LEVELS)
+
+    # One series per office x gender x education level
+    office_idx, gender_idx, edu_idx = np.meshgrid(
+        np.arange(n_offices), np.arange(len(GENDER_SHARE)), np.arange(len(codes)), indexing='ij')
+    office_idx, gender_idx, edu_idx = office_idx.ravel(), gender_idx.ravel(), edu_idx.ravel()
+
+    office_size = rng.lognormal(0, 0.5, n_offices) * OFFICE_STOCK
+    office_size *= np.array([WIEN_FACTOR if _office_state(code) == 9 else 1 for code, _ in offices])
+    level = (office_size[office_idx]
+             * np.array(list(GENDER_SHARE.values()))[gender_idx]
+             * np.array([share for _, share in EDUCATION_LEVELS.values()])[edu_idx]
+             * rng.lognormal(0, 0.3, len(office_idx)))
+    stock = rng.poisson(level)
+
+    static = pd.DataFrame({
+        'RGSCode': np.array([code for code, _ in offices])[office_idx],
+        'RGSName': pd.Categorical.from_codes(office_idx, [name for _, name in offices]),
+        'Geschlecht': pd.Categorical.from_codes(gender_idx, list(GENDER_SHARE)),
+        'AusbCode': pd.Categorical.from_codes(edu_idx, codes),
+        'HoeAbgAusbildung': pd.Categorical.from_codes(edu_idx, [name for name, _ in EDUCATION_LEVELS.values()]),
+    })
+
+    remaining = rows
+    for month in pd.period_range(START_MONTH, periods=n_months, freq='M'):
+        season = 1 + SEASONAL_AMPLITUDE * np.cos(2 * np.pi * (month.month - 1) / 12)
+        inflow = rng.poisson(level * INFLOW_RATE * season)
+        # Each registered person leaves with the same probability, which pulls
+        # the stock back towards its (seasonal) level
+        outflow = rng.binomial(stock + inflow, INFLOW_RATE / (1 + INFLOW_RATE))
+        stock = stock + inflow - outflow
+
+        frame = static.copy()
+        frame.insert(0, 'Datum', month.end_time.strftime('%Y-%m-%d'))
+        frame['BESTAND'] = stock
+        frame['ZUGANG'] = inflow
+        frame['ABGANG'] = outflow
+
+        if len(frame) >= remaining:
+            yield frame.iloc[:remaining]
+            return
+        remaining -= len(frame)
+        yield frame
+
+
+def generate_csv(path: str, rows: int, encoding: str = 'utf-8', seed: int = 0) -> int:
+    """Write `rows` synthetic rows to `path` (';'-separated, like the AMS extract)."""
+    written = 0
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        for i, frame in enumerate(generate_months(rows, seed)):
+            frame.to_csv(f, sep=';', index=False, header=(i == 0), lineterminator='\n')
+            written += len(frame)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a synthetic AMS-shaped CSV")
+    parser.add_argument('path')
+    parser.add_argument('--rows', type=int, default=100_000, help="Number of data rows (default 100,000)")
+    parser.add_argument('--encoding', default='utf-8', choices=['utf-8', 'cp1252'])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    n_offices, n_months = _layout(args.rows)
+    print(f"🧪 Generating {args.rows:,} rows ({n_offices} offices x {n_months} months) -> {args.path}")
+    start = time.perf_counter()
+    try:
+        written = generate_csv(args.path, args.rows, args.encoding, args.seed)
+    except OSError as e:
+        print(f"❌ Could not write {args.path}: {e}")
+        sys.exit(1)
+    print(f"✅ Wrote {written:,} rows ({args.encoding}) in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Dashboard Importer for Container Startup
+
+Imports the dashboard bundles (*.zip exports and legacy *.json) of the
+dashboards folder in one process, replacing one `superset import-dashboards`
+call - and one Superset app start - per file:
+
+  • A manifest of SHA-256 checksums records what was imported; unchanged
+    bundles are skipped
+  • The dashboards (UUIDs) of each recorded bundle are checked against the
+    metadata database with one query, so a reset database is re-imported
+  • The Superset app is only created when something needs importing, and
+    then once for all bundles
+
+The manifest lives in SUPERSET_HOME (the superset-data volume), next to the
+state it describes. A failed bundle is not recorded and is retried on the
+next start.
+
+Usage (called by docker-entrypoint.sh):
+    python /app/superset_home/utils/import_dashboards.py [/app/superset_home/dashboards] [--force]
+"""
+
+import os
+import sys
+import json
+import runpy
+import hashlib
+import argparse
+from datetime import datetime
+from pathlib import Path
+from zipfile import ZipFile, is_zipfile
+
+DASHBOARD_DIR = '/app/superset_home/dashboards'
+MANIFEST_PATH = str(Path(os.environ.get('SUPERSET_HOME', '/app/superset')) / 'dashboard_import_manifest.json')
+BUNDLE_SUFFIXES = ('.json', '.zip')
+
+
+def file_checksum(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bundle_files(directory: str) -> list:
+    """Bundles at the top level of the folder (sub-folders are not imported)."""
+    return sorted(path for path in Path(directory).iterdir()
+                  if path.is_file() and path.suffix in BUNDLE_SUFFIXES)
+
+
+def load_manifest(path: str) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path: str, manifest: dict):
+    # Written atomically - an interrupted start leaves the previous manifest
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, path)
+
+
+def bundle_uuids(path: Path) -> list:
+    """UUIDs of the dashboards in a zip export (legacy JSON exports have none)."""
+    if not is_zipfile(path):
+        return []
+    import yaml
+
+    uuids = []
+    with ZipFile(path) as bundle:
+        for name in bundle.namelist():
+            # <export root>/dashboards/<name>.yaml
+            if name.split('/')[-2:-1] == ['dashboards'] and name.endswith(('.yaml', '.yml')):
+                config = yaml.safe_load(bundle.read(name)) or {}
+                if config.get('uuid'):
+                    uuids.append(str(config['uuid']).lower())
+    return uuids
+
+
+def existing_dashboard_uuids() -> set:
+    """
+    UUIDs of all dashboards in the metadata database, queried directly with
+    the URI of superset_config.py (no Superset app needed). None on failure.
+    """
+    from sqlalchemy import create_engine, text
+
+    try:
+        config = runpy.run_path(os.environ.get('SUPERSET_CONFIG_PATH', '/app/superset/superset_config.py'))
+        engine = create_engine(config['SQLALCHEMY_DATABASE_URI'])
+        with engine.connect() as conn:
+            return {str(row[0]).lower() for row in conn.execute(text("SELECT uuid FROM dashboards"))}
+    except Exception as e:
+        print(f"  ⚠️  Could not check existing dashboards ({e}) - importing all bundles")
+        return None
+
+
+def pending_bundles(files: list, manifest: dict, force: bool = False) -> list:
+    """(path, checksum) of the bundles that need importing."""
+    checksums = {path: file_checksum(path) for path in files}
+    if force:
+        return list(checksums.items())
+
+    changed = [(path, checksum) for path, checksum in checksums.items()
+               if manifest.get(path.name, {}).get('sha256') != checksum]
+    recorded = {path: checksum for path, checksum in checksums.items()
+                if (path, checksum) not in changed and manifest[path.name].get('dashboards')}
+    if not recorded:
+        return changed
+
+    existing = existing_dashboard_uuids()
+    missing = [(path, checksum) for path, checksum in recorded.items()
+               if existing is None or not set(manifest[path.name]['dashboards']) <= existing]
+    return sorted(changed + missing)
+
+
+def import_bundles(bundles: list, username: str = 'admin') -> dict:
+    """
+    Import the bundles in one Superset app context.
+    Returns {file name: error message or None}.
+    """
+    from superset.app import create_app
+
+    app = create_app()
+    results = {}
+    with app.app_context():
+        from superset import security_manager
+        from superset.commands.dashboard.importers.dispatcher import ImportDashboardsCommand
+        from superset.commands.importers.v1.utils import get_contents_from_bundle
+        from superset.utils.core import override_user
+
+        user = security_manager.find_user(username=username)
+        for path in bundles:
+            print(f"  ↳ Importing: {path.name}")
+            try:
+                if is_zipfile(path):
+                    with ZipFile(path) as bundle:
+                        contents = get_contents_from_bundle(bundle)
+                else:
+                    contents = {path.name: path.read_text(encoding='utf-8')}
+                with override_user(user):
+                    ImportDashboardsCommand(contents, overwrite=True).run()
+            except Exception as e:
+                results[path.name] = str(e) or type(e).__name__
+                print(f"    ❌ Import failed: {results[path.name]}")
+                continue
+            results[path.name] = None
+            print("    ✅ Imported successfully")
+    return results
+
+
+def import_dashboards(directory: str = DASHBOARD_DIR, manifest_path: str = MANIFEST_PATH,
+                      username: str = 'admin', force: bool = False) -> bool:
+    """Import new and changed bundles; returns False if any import failed."""
+    if not Path(directory).is_dir():
+        print(f"  ℹ️  Dashboard directory not found: {directory}")
+        return True
+    files = bundle_files(directory)
+    if not files:
+        print(f"  ℹ️  No dashboard files found in {directory}")
+        return True
+
+    recorded = load_manifest(manifest_path)
+    # Forget bundles that were removed from the folder
+    manifest = {name: entry for name, entry in recorded.items() if name in {path.name for path in files}}
+    pending = pending_bundles(files, manifest, force)
+    print(f"📦 Found {len(files)} dashboard file(s), {len(pending)} to import")
+    if not pending:
+        if manifest != recorded:
+            save_manifest(manifest_path, manifest)
+        return True
+
+    results = import_bundles([path for path, _ in pending], username)
+    for path, checksum in pending:
+        if results.get(path.name) is None:
+            manifest[path.name] = {
+                'sha256': checksum,
+                'imported_at': datetime.now().isoformat(timespec='seconds'),
+                'dashboards': bundle_uuids(path),
+            }
+    save_manifest(manifest_path, manifest)
+
+    failed = [name for name, error in results.items() if error]
+    print(f"  ✅ Imported {len(results) - len(failed)} of {len(pending)} bundle(s)")
+    return not failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Import new and changed dashboard bundles in one process")
+    parser.add_argument('directory', nargs='?', default=DASHBOARD_DIR)
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help="Checksum manifest of imported bundles")
+    parser.add_argument('--username', default='admin', help="Owner of the imported objects")
+    parser.add_argument('--force', action='store_true', help="Import all bundles, ignoring the manifest")
+    args = parser.parse_args()
+
+    if not import_dashboards(args.directory, args.manifest, args.username, args.force):
+        sys.exit(1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Stage Instrumentation for the Report and Ingest Pipelines
+
+A Tracer records, per named stage:
+
+  • wall time and CPU time
+  • peak RSS of the process at the end of the stage, and how much the stage
+    raised it (a stage that doesn't set a new high-water mark shows 0)
+  • rows processed (set by the caller)
+
+and exports them as a JSON trace and as a Prometheus textfile (for the
+node_exporter textfile collector). Selected stages can additionally be run
+under cProfile (.prof files for snakeviz / pstats) and tracemalloc (peak
+traced memory and top allocation sites in the trace).
+
+    tracer = Tracer('report', profile={'load_data'})
+    with tracer.stage('load_data') as stage:
+        df = load_data(csv_path)
+        stage.rows = len(df)
+    tracer.write_json('/tmp/report_trace.json')
+    tracer.write_prometheus('/var/lib/node_exporter/report.prom')
+"""
+
+import os
+import json
+import time
+import cProfile
+import resource
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_DIR = os.environ.get('PROFILE_DIR', '/tmp/profiles')
+METRIC_PREFIX = 'ams_pipeline'
+TOP_ALLOCATIONS = 10
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _selected(name: str, stages) -> bool:
+    return bool(stages) and ('all' in stages or name in stages)
+
+
+class Stage:
+    """Measurements of one stage; `rows` may be set inside the with block."""
+
+    def __init__(self, name: str, parent: str = None, depth: int = 0):
+        self.name = name
+        self.parent = parent
+        self.depth = depth
+        self.rows = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes = 0
+        self.rss_growth_bytes = 0
+        self.profile_file = None
+        self.traced_peak_bytes = None
+        self.top_allocations = None
+
+    def as_dict(self) -> dict:
+        return {key: value for key, value in vars(self).items() if value is not None}
+
+
+class Tracer:
+    """Collects Stage records for one pipeline run."""
+
+    def __init__(self, pipeline: str = 'report', profile=None, trace_malloc=None,
+                 profile_dir: str = PROFILE_DIR):
+        self.pipeline = pipeline
+        self.profile = set(profile or [])
+        self.trace_malloc = set(trace_malloc or [])
+        self.profile_dir = profile_dir
+        self.started = datetime.now()
+        self.stages = []
+        self._stack = []
+        self._profiling = False
+
+    @contextmanager
+    def stage(self, name: str, rows: int = None):
+        record = Stage(name, self._stack[-1].name if self._stack else None, len(self._stack))
+        record.rows = rows
+
+        # One cProfile at a time - nested stages are part of the outer profile
+        profiler = None
+        if _selected(name, self.profile) and not self._profiling:
+            profiler, self._profiling = cProfile.Profile(), True
+        malloc = _selected(name, self.trace_malloc) and not tracemalloc.is_tracing()
+        if malloc:
+            tracemalloc.start()
+
+        self.stages.append(record)
+        self._stack.append(record)
+        rss_before = _peak_rss_bytes()
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler:
+                profiler.disable()
+                self._profiling = False
+            record.wall_seconds = round(time.perf_counter() - wall, 6)
+            record.cpu_seconds = round(time.process_time() - cpu, 6)
+            record.peak_rss_bytes = _peak_rss_bytes()
+            record.rss_growth_bytes = record.peak_rss_bytes - rss_before
+            self._stack.pop()
+
+            if profiler:
+                Path(self.profile_dir).mkdir(parents=True, exist_ok=True)
+                record.profile_file = str(Path(self.profile_dir) / f"{self.pipeline}_{name}.prof")
+                profiler.dump_stats(record.profile_file)
+            if malloc:
+                snapshot = tracemalloc.take_snapshot()
+                record.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                record.top_allocations = [
+                    {'site': str(stat.traceback), 'bytes': stat.size, 'count': stat.count}
+                    for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]
+                ]
+
+    def extend(self, records: list, parent: str = None):
+        """Add stages recorded elsewhere (e.g. in a worker process) below the current stage."""
+        for record in records:
+            record.parent = record.parent or parent
+            record.depth += len(self._stack)
+            self.stages.append(record)
+
+    def as_dict(self) -> dict:
+        return {
+            'pipeline': self.pipeline,
+            'started': self.started.isoformat(timespec='seconds'),
+            'pid': os.getpid(),
+            'stages': [record.as_dict() for record in self.stages],
+        }
+
+    def write_json(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(self.as_dict(), indent=2))
+
+    def write_prometheus(self, path: str):
+        """
+        Write the stages in the Prometheus text format. The file is replaced
+        atomically so the textfile collector never reads a partial file.
+        """
+        metrics = {
+            'stage_wall_seconds': ('gauge', 'Wall time of the stage', 'wall_seconds'),
+            'stage_cpu_seconds': ('gauge', 'CPU time of the stage', 'cpu_seconds'),
+            'stage_peak_rss_bytes': ('gauge', 'Peak RSS of the process at the end of the stage',
+                                     'peak_rss_bytes'),
+            'stage_rows': ('gauge', 'Rows processed by the stage', 'rows'),
+        }
+        lines = []
+        for metric, (kind, help_text, attr) in metrics.items():
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for record in self.stages:
+                value = getattr(record, attr)
+                if value is not None:
+                    labels = f'pipeline="{self.pipeline}",stage="{record.name}",parent="{record.parent or ""}"'
+                    lines.append(f'{name}{{{labels}}} {value}')
+
+        name = f"{METRIC_PREFIX}_last_run_timestamp_seconds"
+        lines += [f"# HELP {name} Start time of the last run", f"# TYPE {name} gauge",
+                  f'{name}{{pipeline="{self.pipeline}"}} {self.started.timestamp():.0f}']
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        Path(tmp_path).write_text('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+
+    def print_summary(self):
+        print(f"⏱️  Stage timings ({self.pipeline}):")
+        for record in self.stages:
+            indent = '   ' * record.depth
+            rows = f"  {record.rows:,} rows" if record.rows is not None else ''
+            print(f"   {indent}{record.name:32s} {record.wall_seconds:8.3f}s wall "
+                  f"{record.cpu_seconds:8.3f}s cpu  {record.peak_rss_bytes / 2**20:8.1f} MB peak{rows}")
+
+    def export(self, json_path: str = None, prometheus_path: str = None):
+        """Write whichever outputs were requested."""
+        if json_path:
+            self.write_json(json_path)
+            print(f"💾 Trace written to {json_path}")
+        if prometheus_path:
+            self.write_prometheus(prometheus_path)
+            print(f"💾 Prometheus metrics written to {prometheus_path}")
+
+
+def add_arguments(parser):
+    """Instrumentation options shared by the pipeline CLIs."""
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help="Write per-stage timings and memory as a JSON trace")
+    parser.add_argument('--prometheus', metavar='PATH', default=None,
+                        help="Write per-stage metrics as a Prometheus textfile")
+    parser.add_argument('--profile', nargs='+', metavar='STAGE', default=None,
+                        help=f"Run these stages (or 'all') under cProfile, .prof files in {PROFILE_DIR}")
+    parser.add_argument('--trace-malloc', nargs='+', metavar='STAGE', default=None,
+                        help="Run these stages (or 'all') under tracemalloc, results in the trace")
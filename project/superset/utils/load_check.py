@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Web Server Load Check
+
+Measures requests/sec and latency of a Superset endpoint under concurrent
+load. Every client is its own process (keep-alive session, one request at a
+time), so the load generator isn't limited by the GIL.
+
+Against a running server:
+    python load_check.py --url http://localhost:8088 --path /health --clients 32 --duration 10
+
+Scaling with the gunicorn worker count - starts gunicorn with
+gunicorn_config.py on a spare port once per count (run inside the container):
+    python load_check.py --workers 1 2 4 8 --path /health/ready
+"""
+
+import os
+import sys
+import time
+import signal
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import requests
+
+GUNICORN_CONFIG = str(Path(__file__).resolve().parent.parent / 'gunicorn_config.py')
+GUNICORN_APP = 'superset.app:create_app()'
+STARTUP_TIMEOUT = 180
+
+
+def _client(url: str, start_at: float, deadline: float) -> tuple:
+    """One client: request `url` back to back from `start_at` to `deadline`; (latencies, errors)."""
+    session = requests.Session()
+    latencies, errors = [], 0
+    time.sleep(max(0.0, start_at - time.time()))
+    while time.time() < deadline:
+        start = time.perf_counter()
+        try:
+            response = session.get(url, timeout=30)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+        except requests.RequestException:
+            errors += 1
+    return latencies, errors
+
+
+def run_load(url: str, clients: int, duration: float) -> dict:
+    """Requests/sec, latency percentiles and errors of `clients` concurrent clients."""
+    # Clients start together once the pool is up
+    start_at = time.time() + 1
+    with ProcessPoolExecutor(max_workers=clients) as pool:
+        futures = [pool.submit(_client, url, start_at, start_at + duration) for _ in range(clients)]
+        results = [future.result() for future in futures]
+
+    latencies = sorted(latency for client, _ in results for latency in client)
+    errors = sum(client_errors for _, client_errors in results)
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000 if latencies else float('nan')
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / duration,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+    }
+
+
+def wait_until_up(url: str, process: subprocess.Popen, timeout: float = STARTUP_TIMEOUT) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            if requests.get(url, timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(1)
+    return False
+
+
+def start_gunicorn(workers: int, port: int, app: str = GUNICORN_APP,
+                   config: str = GUNICORN_CONFIG) -> subprocess.Popen:
+    env = dict(os.environ, GUNICORN_WORKERS=str(workers), GUNICORN_BIND=f'127.0.0.1:{port}')
+    return subprocess.Popen(
+        ['gunicorn', '--config', config, '--access-logfile', '/dev/null', app],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+def stop(process: subprocess.Popen):
+    # Gunicorn stops its workers on SIGTERM to the master
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def scaling(worker_counts: list, path: str, clients: int, duration: float, port: int,
+            app: str = GUNICORN_APP) -> dict:
+    """run_load() results per gunicorn worker count."""
+    results = {}
+    for workers in worker_counts:
+        print(f"🚀 gunicorn with {workers} worker(s) on port {port}...")
+        process = start_gunicorn(workers, port, app)
+        try:
+            url = f"http://127.0.0.1:{port}{path}"
+            if not wait_until_up(url, process):
+                print(f"   ❌ Server did not come up within {STARTUP_TIMEOUT}s")
+                continue
+            results[workers] = run_load(url, clients, duration)
+            print_result(f"{workers} worker(s)", results[workers])
+        finally:
+            stop(process)
+    return results
+
+
+def print_result(label: str, result: dict):
+    print(f"   {label:14s} {result['rps']:9.1f} req/s   p50 {result['p50_ms']:7.1f} ms   "
+          f"p95 {result['p95_ms']:7.1f} ms   p99 {result['p99_ms']:7.1f} ms   {result['errors']} error(s)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Requests/sec of Superset under concurrent load")
+    parser.add_argument('--url', default='http://localhost:8088', help="Running server (without --workers)")
+    parser.add_argument('--path', default='/health', help="Endpoint to request (default /health)")
+    parser.add_argument('--clients', type=int, default=2 * os.cpu_count(), help="Concurrent clients")
+    parser.add_argument('--duration', type=float, default=10, help="Seconds per measurement")
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help="Start gunicorn with each of these worker counts and compare")
+    parser.add_argument('--port', type=int, default=8089, help="Port for the gunicorn runs")
+    parser.add_argument('--app', default=GUNICORN_APP, help="WSGI app for the gunicorn runs")
+    args = parser.parse_args()
+
+    if not args.workers:
+        print(f"🔥 {args.clients} client(s) on {args.url}{args.path} for {args.duration:.0f}s...")
+        print_result('server', run_load(f"{args.url}{args.path}", args.clients, args.duration))
+        sys.exit(0)
+
+    results = scaling(args.workers, args.path, args.clients, args.duration, args.port, args.app)
+    if not results:
+        sys.exit(1)
+    base_workers = min(results)
+    print(f"\n📊 Scaling ({args.clients} clients, {args.path}):")
+    for workers, result in results.items():
+        speedup = result['rps'] / results[base_workers]['rps'] if results[base_workers]['rps'] else 0
+        print(f"   {workers:3d} worker(s) {result['rps']:9.1f} req/s  x{speedup:.2f} vs {base_workers}")
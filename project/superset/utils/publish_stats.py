@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Publish the Statistical Report as Summary Tables
+
+Writes the tables of the statistical report to small tables in the data
+schema, so Superset charts read precomputed rows instead of aggregating
+data.austrian_employment on every dashboard load:
+
+  data.stats_univariate    data.stats_gender
+  data.stats_categorical   data.stats_education
+  data.stats_correlation   data.stats_regional
+                           data.stats_temporal
+
+All tables are replaced in one transaction - viewers see either the previous
+or the new report, never a mix. Every row carries the report version, and
+data.stats_versions records when each version was published and from how
+many source rows.
+
+Run after every load (create_sample_dashboard.py does this automatically):
+    docker-compose exec superset python /app/superset_home/utils/publish_stats.py
+"""
+
+import sys
+import argparse
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from sql_backend import DATABASE_URL, compute_analyses_sql
+from data_versions import bump_data_versions
+
+STATS_SCHEMA = 'data'
+VERSIONS_TABLE = 'data.stats_versions'
+
+
+def _categorical_long(categorical: dict) -> pd.DataFrame:
+    """One row per (variable, category), ranked by count."""
+    frames = []
+    for var_name, freq in categorical.items():
+        frame = freq.rename(columns={var_name: 'category'})
+        frame.insert(0, 'variable', var_name)
+        frame.insert(2, 'rank', range(1, len(frame) + 1))
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _correlation_long(corr: pd.DataFrame) -> pd.DataFrame:
+    """One row per variable pair - the layout of Superset's heatmap chart."""
+    return corr.rename_axis(index='variable_x', columns='variable_y').stack().rename('correlation').reset_index()
+
+
+def stats_tables(results: dict) -> dict:
+    """Map the report results to publishable frames: table name -> DataFrame."""
+    return {
+        'stats_univariate': results['univariate'],
+        'stats_categorical': _categorical_long(results['categorical']),
+        'stats_correlation': _correlation_long(results['correlation']),
+        'stats_gender': results['gender'],
+        'stats_education': results['education'],
+        'stats_regional': results['regional'],
+        'stats_temporal': results['temporal'],
+    }
+
+
+def publish_stats(engine, results: dict, source_rows: int = None) -> int:
+    """
+    Replace the data.stats_* tables with the given report results.
+    Returns the new report version.
+    """
+    tables = stats_tables(results)
+
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {STATS_SCHEMA}"))
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {VERSIONS_TABLE} (
+                version INTEGER PRIMARY KEY,
+                published_at TIMESTAMP NOT NULL DEFAULT now(),
+                source_rows BIGINT,
+                tables TEXT
+            )
+        """))
+        # Serialize concurrent publishers on the version counter
+        conn.execute(text(f"LOCK TABLE {VERSIONS_TABLE} IN EXCLUSIVE MODE"))
+        version = conn.execute(text(f"SELECT COALESCE(MAX(version), 0) + 1 FROM {VERSIONS_TABLE}")).scalar()
+
+        for name, frame in tables.items():
+            frame = frame.reset_index(drop=True)
+            frame.insert(0, 'version', version)
+            frame.to_sql(name, conn, schema=STATS_SCHEMA, if_exists='replace', index=False)
+
+        conn.execute(text(f"INSERT INTO {VERSIONS_TABLE} (version, source_rows, tables) "
+                          f"VALUES (:version, :source_rows, :tables)"),
+                     {'version': version, 'source_rows': source_rows, 'tables': ', '.join(tables)})
+        # Invalidates the cached chart results of the report tables
+        bump_data_versions(conn, [f"{STATS_SCHEMA}.{name}" for name in tables], source_rows)
+
+    return version
+
+
+def publish_report(engine) -> bool:
+    """Compute the report in the database (see sql_backend.py) and publish it."""
+    print("📤 Publishing report tables...")
+    try:
+        results = compute_analyses_sql(engine)
+        version = publish_stats(engine, results, results['summary']['rows'])
+    except Exception as e:
+        print(f"   ❌ Publishing failed: {e}")
+        return False
+
+    print(f"   ✅ Published version {version}: "
+          f"{', '.join(f'{STATS_SCHEMA}.{name}' for name in stats_tables(results))}")
+    return True
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Publish the statistical report as data.stats_* tables")
+    parser.add_argument('--database-url', default=DATABASE_URL)
+    args = parser.parse_args()
+
+    if not publish_report(create_engine(args.database_url)):
+        sys.exit(1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Statistical Report as a Celery Task
+
+Runs generate_statistical_report() of analyze_data.py on Superset's Celery
+app, routed to its own "reports" queue (CELERY_CONFIG.task_routes in
+superset_config.py). A dedicated worker serves that queue with low
+concurrency and a prefetch of 1, so long reports never sit in front of
+SQL Lab queries on the default queue:
+
+    celery --app=superset.tasks.celery_app:app worker --queues=reports \\
+        --concurrency=2 --prefetch-multiplier=1 -O fair
+
+(the superset-worker-reports service in docker-compose.yml). The result -
+the printed report and every table as JSON - is kept in the Celery result
+backend and can be polled by task id.
+
+Usage:
+    python report_tasks.py submit [--backend sql|csv] [--csv PATH] [--publish] [--wait]
+    python report_tasks.py status <task id> [--print]
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+from datetime import datetime
+
+from superset.extensions import celery_app
+
+REPORT_QUEUE = 'reports'
+REPORT_TASK = 'ams.generate_statistical_report'
+# Reports on the full history take minutes; anything beyond this is stuck
+REPORT_SOFT_TIME_LIMIT = 30 * 60
+POLL_INTERVAL = 2
+
+
+def _tables_json(results: dict) -> dict:
+    """The report tables in the layout of publish_stats (DataFrame 'split' JSON)."""
+    from publish_stats import stats_tables
+
+    return {name: json.loads(frame.to_json(orient='split', index=False, date_format='iso'))
+            for name, frame in stats_tables(results).items()}
+
+
+@celery_app.task(name=REPORT_TASK, bind=True, acks_late=True, soft_time_limit=REPORT_SOFT_TIME_LIMIT)
+def generate_report(self, csv_path: str = '/tmp/data.csv', backend: str = 'sql',
+                    database_url: str = None, publish: bool = False) -> dict:
+    """
+    Generate the statistical report. The analyses run sequentially - the
+    worker processes are daemonic and can't start a process pool of their own.
+    """
+    from analyze_data import generate_statistical_report
+
+    self.update_state(state='PROGRESS', meta={'step': 'analyses', 'backend': backend})
+    started = time.perf_counter()
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        results = generate_statistical_report(csv_path, backend=backend, database_url=database_url)
+
+    version = None
+    if publish:
+        from sqlalchemy import create_engine
+        from publish_stats import publish_stats
+        from sql_backend import DATABASE_URL
+
+        self.update_state(state='PROGRESS', meta={'step': 'publish', 'backend': backend})
+        version = publish_stats(create_engine(database_url or DATABASE_URL), results)
+
+    return {
+        'backend': backend,
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'seconds': round(time.perf_counter() - started, 3),
+        'published_version': version,
+        'report': report.getvalue(),
+        'tables': _tables_json(results),
+    }
+
+
+def submit_report(**kwargs):
+    """Queue a report (routed to REPORT_QUEUE); returns the AsyncResult."""
+    return generate_report.apply_async(kwargs=kwargs, queue=REPORT_QUEUE)
+
+
+def report_status(task_id: str) -> dict:
+    """State of a report task: {'state', 'info'} - info is the result once it is SUCCESS."""
+    result = celery_app.AsyncResult(task_id)
+    info = result.info
+    if isinstance(info, Exception):
+        info = {'error': f"{type(info).__name__}: {info}"}
+    return {'state': result.state, 'info': info}
+
+
+def _print_status(task_id: str, status: dict, print_report: bool = False):
+    state, info = status['state'], status['info'] or {}
+    if state == 'SUCCESS':
+        print(f"✅ {task_id}: done in {info['seconds']:.1f}s ({info['backend']} backend), "
+              f"{len(info['tables'])} table(s)"
+              + (f", published as version {info['published_version']}" if info['published_version'] else ''))
+        if print_report:
+            print(info['report'])
+    elif state == 'FAILURE':
+        print(f"❌ {task_id}: {info.get('error')}")
+    elif state == 'PROGRESS':
+        print(f"⏳ {task_id}: running ({info.get('step')})")
+    else:
+        print(f"⏳ {task_id}: {state.lower()}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the statistical report on the Celery 'reports' queue")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit = commands.add_parser('submit', help="Queue a report")
+    submit.add_argument('--backend', choices=['csv', 'sql'], default='sql',
+                        help="sql (default): aggregate data.austrian_employment; csv: load --csv on the worker")
+    submit.add_argument('--csv', default='/tmp/data.csv', help="CSV path on the worker (--backend csv)")
+    submit.add_argument('--database-url', default=None)
+    submit.add_argument('--publish', action='store_true', help="Also write the data.stats_* tables")
+    submit.add_argument('--wait', action='store_true', help="Poll until the report is done")
+
+    status = commands.add_parser('status', help="Show the state of a report task")
+    status.add_argument('task_id')
+    status.add_argument('--print', action='store_true', help="Print the report text once done")
+    args = parser.parse_args()
+
+    # Configures celery_app from CELERY_CONFIG (broker and result backend)
+    import superset.tasks.celery_app  # noqa: F401
+
+    if args.command == 'submit':
+        task = submit_report(csv_path=args.csv, backend=args.backend,
+                             database_url=args.database_url, publish=args.publish)
+        print(f"📨 Queued report {task.id} on '{REPORT_QUEUE}'")
+        if not args.wait:
+            print(f"   Poll with: python report_tasks.py status {task.id}")
+            sys.exit(0)
+        task_id = task.id
+        while report_status(task_id)['state'] not in ('SUCCESS', 'FAILURE', 'REVOKED'):
+            time.sleep(POLL_INTERVAL)
+        args.print = True
+    else:
+        task_id = args.task_id
+
+    result = report_status(task_id)
+    _print_status(task_id, result, args.print)
+    if result['state'] == 'FAILURE':
+        sys.exit(1)
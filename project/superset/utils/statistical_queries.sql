@@ -1,5 +1,12 @@
 -- Statistical Queries for Superset Dashboard
 -- Use these in SQL Lab or as Virtual Datasets
+--
+-- Precomputed versions of these queries are kept as materialized views in the
+-- `data` schema (mv_summary_stats, mv_education_distribution, mv_gender_comparison,
+-- mv_education_by_gender, mv_monthly_trends, mv_regional_rankings, mv_correlations,
+-- mv_bestand_histogram, mv_box_plot_education, mv_key_insights, mv_monthly_cube).
+-- They are built/refreshed after every load by build_aggregates.py - point
+-- datasets at them instead of the raw table for fast dashboards.
 
 -- ============================================================================
 -- UNIVARIATE STATISTICS - Summary Statistics Table
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Constant-Memory Streaming Statistics
+
+Computes the univariate and categorical tables of analyze_data.py for
+extracts that don't fit in RAM. The CSV is read in chunks and each chunk
+updates mergeable accumulators:
+
+  • Moments (count, sum, min, max, mean, M2) - merged with Chan's update,
+    exact up to floating point rounding
+  • KLL quantile sketch for Median/Q1/Q3 - rank error about ±1.7% at the
+    default k=200 (exact while a column has fewer than ~k values)
+  • Exact per-category counters for the categorical tables
+
+Partial states merge, so chunks can be processed by several workers.
+
+Usage:
+    python streaming_stats.py /tmp/data.csv [--workers N] [--chunk-rows N]
+"""
+
+import sys
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+import pandas as pd
+
+from analyze_data import CSV_DTYPES, _moments, csv_encoding
+
+NUMERIC_COLS = ['BESTAND', 'ZUGANG', 'ABGANG']
+CATEGORICAL_COLS = ['Geschlecht', 'HoeAbgAusbildung', 'RGSName', 'AusbCode']
+
+DEFAULT_CHUNK_ROWS = 200_000
+DEFAULT_SKETCH_K = 200
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch for one numeric column.
+
+    Items at level h stand for 2**h values. When the sketch exceeds its
+    capacity the lowest full level is sorted and every other item (random
+    offset) is promoted, so memory stays O(k) however many values are added.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int = None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compact(self, level: int):
+        if level + 1 == len(self.levels):
+            self.levels.append(np.empty(0))
+        items = np.sort(self.levels[level])
+        # An odd item out stays behind so weights remain exact
+        leftover, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+        promoted = items[self._rng.integers(2)::2]
+        self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+        self.levels[level] = leftover
+
+    def _compress(self):
+        while sum(map(len, self.levels)) > sum(self._capacity(h) for h in range(len(self.levels))):
+            level = next(h for h in range(len(self.levels)) if len(self.levels[h]) > self._capacity(h))
+            self._compact(level)
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: 'KLLSketch'):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+
+    def quantiles(self, qs: list) -> np.ndarray:
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        if len(self.levels) == 1:
+            # Nothing compacted yet - exact, with pandas' linear interpolation
+            return np.quantile(self.levels[0], qs)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        ranks = np.asarray(qs) * cumulative[-1]
+        return items[np.minimum(np.searchsorted(cumulative, ranks), len(items) - 1)]
+
+
+class StreamingStats:
+    """
+    Mergeable state behind the univariate and categorical tables.
+    update() takes one chunk, merge() combines states from other workers.
+    """
+
+    def __init__(self, numeric_cols: list = None, categorical_cols: list = None,
+                 k: int = DEFAULT_SKETCH_K, seed: int = None):
+        self.numeric_cols = list(numeric_cols or NUMERIC_COLS)
+        self.categorical_cols = list(categorical_cols or CATEGORICAL_COLS)
+        size = len(self.numeric_cols)
+        self.moments = {'n': np.zeros(size), 'sum': np.zeros(size), 'mean': np.zeros(size),
+                        'm2': np.zeros(size), 'min': np.full(size, np.inf), 'max': np.full(size, -np.inf)}
+        self.sketches = [KLLSketch(k, seed) for _ in self.numeric_cols]
+        self.counters = {col: Counter() for col in self.categorical_cols}
+        self.integer_cols = set()
+
+    def _merge_moments(self, other: dict):
+        a, b = self.moments, other
+        total = a['n'] + b['n']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = b['mean'] - a['mean']
+            mean = np.where(total > 0, a['mean'] + delta * b['n'] / total, 0)
+            m2 = a['m2'] + b['m2'] + np.where(total > 0, delta ** 2 * a['n'] * b['n'] / total, 0)
+        self.moments = {'n': total, 'sum': a['sum'] + b['sum'], 'mean': mean, 'm2': m2,
+                        'min': np.fmin(a['min'], b['min']), 'max': np.fmax(a['max'], b['max'])}
+
+    def update(self, chunk: pd.DataFrame):
+        values = chunk[self.numeric_cols].to_numpy(dtype='float64', na_value=np.nan)
+        self._merge_moments(_moments(values))
+        for i, sketch in enumerate(self.sketches):
+            sketch.update(values[:, i])
+        for col in self.numeric_cols:
+            if pd.api.types.is_integer_dtype(chunk[col].dtype):
+                self.integer_cols.add(col)
+        for col, counter in self.counters.items():
+            counts = chunk[col].value_counts(dropna=True)
+            counter.update(counts[counts > 0].to_dict())
+
+    def merge(self, other: 'StreamingStats'):
+        self._merge_moments(other.moments)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        for col, counter in self.counters.items():
+            counter.update(other.counters[col])
+        self.integer_cols |= other.integer_cols
+
+    def univariate_table(self) -> pd.DataFrame:
+        """Same layout and rounding as analyze_data.univariate_statistics()."""
+        stats = []
+        for i, col in enumerate(self.numeric_cols):
+            count = int(self.moments['n'][i])
+            mean = self.moments['mean'][i] if count else np.nan
+            std = np.sqrt(self.moments['m2'][i] / (count - 1)) if count > 1 else np.nan
+            q1, median, q3 = self.sketches[i].quantiles([0.25, 0.5, 0.75])
+            total = self.moments['sum'][i]
+            col_min = self.moments['min'][i] if count else np.nan
+            col_max = self.moments['max'][i] if count else np.nan
+            if col in self.integer_cols:
+                total = int(total)
+                col_min, col_max = (int(col_min), int(col_max)) if count else (np.nan, np.nan)
+
+            stats.append({
+                'Variable': col,
+                'Count': count,
+                'Mean': mean,
+                'Median': median,
+                'Std': std,
+                'Min': col_min,
+                'Q1': q1,
+                'Q3': q3,
+                'Max': col_max,
+                'Sum': total,
+                'CV': (std / mean * 100) if mean != 0 else 0  # Coefficient of variation
+            })
+
+        stats_df = pd.DataFrame(stats)
+        for col in ['Mean', 'Median', 'Std', 'CV']:
+            stats_df[col] = stats_df[col].round(2)
+        return stats_df
+
+    def categorical_tables(self) -> dict:
+        """Same layout as analyze_data.categorical_statistics() (exact counts)."""
+        stats = {}
+        for col, counter in self.counters.items():
+            freq = pd.DataFrame(counter.most_common(), columns=[col, 'Count'])
+            freq['Percentage'] = (freq['Count'] / freq['Count'].sum() * 100).round(2)
+            freq['Cumulative_Pct'] = freq['Percentage'].cumsum().round(2)
+            stats[col] = freq
+        return stats
+
+
+def _chunk_state(chunk: pd.DataFrame, k: int) -> StreamingStats:
+    """Process pool worker: accumulate one chunk into a fresh state."""
+    state = StreamingStats(k=k)
+    state.update(chunk)
+    return state
+
+
+def streaming_statistics(csv_path: str, encoding: str = None,
+                         chunk_rows: int = DEFAULT_CHUNK_ROWS, workers: int = None,
+                         k: int = DEFAULT_SKETCH_K) -> StreamingStats:
+    """
+    Stream the CSV in chunks into a StreamingStats state.
+
+    With workers > 1 chunks are accumulated in a process pool and the partial
+    states merged here; at most 2 * workers chunks are in flight, so memory
+    stays bounded by chunk size regardless of file size.
+    encoding=None detects it (analyze_data.csv_encoding).
+    """
+    reader = pd.read_csv(csv_path, sep=';', encoding=csv_encoding(csv_path, encoding), chunksize=chunk_rows,
+                         usecols=NUMERIC_COLS + CATEGORICAL_COLS,
+                         dtype={col: CSV_DTYPES[col] for col in NUMERIC_COLS + CATEGORICAL_COLS})
+    state = StreamingStats(k=k)
+
+    if not workers or workers <= 1:
+        for chunk in reader:
+            state.update(chunk)
+        return state
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in reader:
+            pending.add(pool.submit(_chunk_state, chunk, k))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    state.merge(future.result())
+        for future in pending:
+            state.merge(future.result())
+
+    return state
+
+
+def print_streaming_report(state: StreamingStats):
+    """Print the univariate and categorical sections like the full report."""
+    print("=" * 80)
+    print("UNIVARIATE STATISTICS - Numeric Variables (streaming, quantiles ±1.7% rank)")
+    print("=" * 80)
+    print(state.univariate_table().to_string(index=False))
+    print()
+
+    print("=" * 80)
+    print("CATEGORICAL DISTRIBUTIONS")
+    print("=" * 80)
+    for var_name, freq_table in state.categorical_tables().items():
+        print(f"\n{var_name}:")
+        print(freq_table.head(10).to_string(index=False))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Constant-memory univariate and categorical statistics")
+    parser.add_argument('csv_file', nargs='?', default="/tmp/data.csv")
+    parser.add_argument('--workers', type=int, default=None, help="Accumulate chunks in N processes")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--encoding', default=None, help="CSV encoding (default: detected)")
+    args = parser.parse_args()
+
+    try:
+        state = streaming_statistics(args.csv_file, args.encoding, chunk_rows=args.chunk_rows,
+                                     workers=args.workers)
+    except FileNotFoundError:
+        print(f"❌ Error: Could not find file: {args.csv_file}")
+        sys.exit(1)
+
+    print_streaming_report(state)
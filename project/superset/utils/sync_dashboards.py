@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Declarative Dashboard Sync (Dashboards as Code)
+
+Brings Superset in line with a JSON spec of charts and dashboards and only
+writes what differs:
+
+  • The current charts and dashboards are fetched once (paginated list calls)
+  • Each side is reduced to a canonical form (params and query context
+    parsed, keys sorted) and compared by SHA-256 content hash
+  • Only the needed create / update / delete calls are issued, concurrently
+
+Redeploying 200 charts of which 3 changed costs 3 writes. Charts are matched
+by slice_name, dashboards by slug ("<namespace>-<title>"). Objects created
+by this script carry the namespace (chart description, dashboard slug
+prefix); with --prune, managed objects missing from the spec are deleted.
+Charts of the same name created by create_dashboard.py are adopted.
+
+Spec format (keep spec files out of the top level of dashboards/ - the
+container entrypoint imports every *.json there):
+
+    {
+      "namespace": "ams",
+      "dataset": {"database": "examples", "table_name": "austrian_employment"},
+      "charts": [{"slice_name": "...", "viz_type": "pie", "params": {...}}],
+      "dashboards": [{"dashboard_title": "...", "charts": ["<slice_name>", ...]}]
+    }
+
+Usage:
+    python sync_dashboards.py --init ams_dashboards.json      # write the built-in spec
+    python sync_dashboards.py ams_dashboards.json --dry-run
+    python sync_dashboards.py ams_dashboards.json [--prune] [--workers 8]
+    python sync_dashboards.py --regions Linz Graz              # built-in spec, no file
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from create_dashboard import SupersetAPI, DEFAULT_CONCURRENCY, employment_chart_configs, query_context
+
+DEFAULT_NAMESPACE = 'ams'
+MANAGED_BY = 'Managed by sync_dashboards.py'
+
+CHART_COLUMNS = ['id', 'slice_name', 'viz_type', 'params', 'query_context', 'description', 'datasource_id']
+DASHBOARD_COLUMNS = ['id', 'dashboard_title', 'slug', 'published', 'position_json']
+
+
+def _json_value(value, default):
+    """Parse a JSON string field as returned by the API (already parsed values pass through)."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return default
+    return default if value is None else value
+
+
+def content_hash(obj: dict) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def slugify(namespace: str, title: str) -> str:
+    return f"{namespace}-{title.lower().replace(' ', '-')}"
+
+
+def managed_description(namespace: str) -> str:
+    return f"{MANAGED_BY} ({namespace})"
+
+
+def default_spec(namespace: str = DEFAULT_NAMESPACE, regions: list = None) -> dict:
+    """The employment dashboard(s) of create_dashboard.py as a spec."""
+    dashboards = {"Austrian Employment Analysis": employment_chart_configs()}
+    for region in regions or []:
+        dashboards[f"Austrian Employment - {region}"] = employment_chart_configs(region)
+
+    charts = [{**config, 'params': json.loads(config['params'])}
+              for configs in dashboards.values() for config in configs]
+    return {
+        'namespace': namespace,
+        'dataset': {'database': 'examples', 'table_name': 'austrian_employment'},
+        'charts': charts,
+        'dashboards': [{'dashboard_title': title, 'charts': [c['slice_name'] for c in configs]}
+                       for title, configs in dashboards.items()],
+    }
+
+
+def load_spec(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+
+    spec.setdefault('namespace', DEFAULT_NAMESPACE)
+    names = [chart['slice_name'] for chart in spec.get('charts', [])]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate slice_name in spec: {', '.join(duplicates)}")
+    for dashboard in spec.get('dashboards', []):
+        unknown = [name for name in dashboard['charts'] if name not in names]
+        if unknown:
+            raise ValueError(f"Dashboard '{dashboard['dashboard_title']}' references unknown "
+                             f"chart(s): {', '.join(unknown)}")
+    return spec
+
+
+def chart_state(chart: dict, dataset_id: int, namespace: str) -> dict:
+    """Canonical form of a spec chart, as it should be stored."""
+    return {
+        'slice_name': chart['slice_name'],
+        'viz_type': chart['viz_type'],
+        'params': _json_value(chart.get('params'), {}),
+        'query_context': json.loads(query_context(chart['viz_type'], chart.get('params', {}), dataset_id)),
+        'description': managed_description(namespace),
+        'datasource_id': dataset_id,
+    }
+
+
+def current_chart_state(chart: dict) -> dict:
+    """Canonical form of a chart returned by the API."""
+    return {
+        'slice_name': chart['slice_name'],
+        'viz_type': chart.get('viz_type'),
+        'params': _json_value(chart.get('params'), {}),
+        'query_context': _json_value(chart.get('query_context'), None),
+        'description': chart.get('description'),
+        'datasource_id': chart.get('datasource_id'),
+    }
+
+
+def dashboard_state(api: SupersetAPI, title: str, slug: str, chart_ids: list) -> dict:
+    return {
+        'dashboard_title': title,
+        'slug': slug,
+        'published': True,
+        'position_json': json.loads(api._generate_position_json(chart_ids)),
+    }
+
+
+def current_dashboard_state(dashboard: dict) -> dict:
+    return {
+        'dashboard_title': dashboard['dashboard_title'],
+        'slug': dashboard.get('slug'),
+        'published': dashboard.get('published'),
+        'position_json': _json_value(dashboard.get('position_json'), {}),
+    }
+
+
+class DashboardSync:
+    """Diff a spec against the current Superset state and apply the difference."""
+
+    def __init__(self, api: SupersetAPI, spec: dict, prune: bool = False,
+                 max_workers: int = DEFAULT_CONCURRENCY):
+        self.api = api
+        self.spec = spec
+        self.namespace = spec.get('namespace', DEFAULT_NAMESPACE)
+        self.prune = prune
+        self.max_workers = max(1, max_workers)
+        self.failures = {}
+        self.writes = 0
+
+    def fetch(self):
+        """Current charts (by slice_name) and dashboards (by slug), one list pass each."""
+        charts = {}
+        for chart in sorted(self.api.list_objects('chart', columns=CHART_COLUMNS), key=lambda c: c['id']):
+            # With duplicate names the oldest chart is the one kept in sync
+            charts.setdefault(chart['slice_name'], chart)
+        dashboards = {dashboard['slug']: dashboard
+                      for dashboard in self.api.list_objects('dashboard', columns=DASHBOARD_COLUMNS)
+                      if dashboard.get('slug')}
+        return charts, dashboards
+
+    def plan_charts(self, current: dict, dataset_id: int) -> list:
+        """(action, slice_name, chart_id, state) for every chart that needs a write."""
+        plan, wanted = [], set()
+        for chart in self.spec.get('charts', []):
+            name = chart['slice_name']
+            wanted.add(name)
+            state = chart_state(chart, dataset_id, self.namespace)
+            existing = current.get(name)
+            if existing is None:
+                plan.append(('create', name, None, state))
+            elif content_hash(current_chart_state(existing)) != content_hash(state):
+                plan.append(('update', name, existing['id'], state))
+
+        if self.prune:
+            plan += [('delete', name, chart['id'], None) for name, chart in current.items()
+                     if name not in wanted and chart.get('description') == managed_description(self.namespace)]
+        return plan
+
+    def plan_dashboards(self, current: dict, chart_ids: dict) -> list:
+        """(action, title, dashboard_id, state) for every dashboard that needs a write."""
+        plan, wanted = [], set()
+        for dashboard in self.spec.get('dashboards', []):
+            title = dashboard['dashboard_title']
+            slug = dashboard.get('slug') or slugify(self.namespace, title)
+            wanted.add(slug)
+            # Charts still to be created (dry run) have no id yet - left out of the layout
+            ids = [chart_ids[name] for name in dashboard['charts'] if chart_ids.get(name) is not None]
+            state = dashboard_state(self.api, title, slug, ids)
+            existing = current.get(slug)
+            if existing is None:
+                plan.append(('create', title, None, state))
+            elif (len(ids) < len(dashboard['charts'])
+                  or content_hash(current_dashboard_state(existing)) != content_hash(state)):
+                plan.append(('update', title, existing['id'], state))
+
+        if self.prune:
+            plan += [('delete', dashboard['dashboard_title'], dashboard['id'], None)
+                     for slug, dashboard in current.items()
+                     if slug not in wanted and slug.startswith(f"{self.namespace}-")]
+        return plan
+
+    def _chart_write(self, action: str, chart_id: int, state: dict, dataset_id: int) -> int:
+        config = {key: state[key] for key in ('slice_name', 'viz_type', 'description')}
+        config['params'] = json.dumps(state['params'], sort_keys=True)
+        config['query_context'] = json.dumps(state['query_context'], sort_keys=True)
+        if action == 'create':
+            return self.api.create_chart(dataset_id, config)
+        return self.api.update_chart(chart_id, config, dataset_id)
+
+    def _dashboard_write(self, action: str, dashboard_id: int, state: dict) -> int:
+        chart_ids = [item['meta']['chartId'] for item in state['position_json'].values()]
+        if action == 'create':
+            return self.api.create_dashboard(state['dashboard_title'], chart_ids, state['slug'])
+        return self.api.update_dashboard(dashboard_id, state['dashboard_title'], chart_ids, state['slug'])
+
+    def _apply(self, pool, plan: list, write, delete) -> dict:
+        """Run the writes of a plan concurrently; returns name -> id of created/updated objects."""
+        futures = {}
+        for action, name, object_id, state in plan:
+            if action == 'delete':
+                futures[pool.submit(delete, object_id)] = (action, name)
+            else:
+                futures[pool.submit(write, action, object_id, state)] = (action, name)
+
+        ids = {}
+        for future in as_completed(futures):
+            action, name = futures[future]
+            self.writes += 1
+            try:
+                result = future.result()
+            except Exception as e:
+                self.failures[name] = str(e)
+                print(f"❌ Failed to {action} '{name}': {e}")
+                continue
+            if action != 'delete':
+                ids[name] = result
+        return ids
+
+    def run(self, dry_run: bool = False) -> dict:
+        """
+        Sync the spec. Returns the plan as {'charts': [...], 'dashboards': [...]}
+        of (action, name) pairs; with dry_run nothing is written.
+        """
+        dataset = self.spec['dataset']
+        database_id = self.api.get_database_id(dataset.get('database', 'examples'))
+        if dry_run:
+            dataset_id = self.api.get_dataset_id(database_id, dataset['table_name'])
+        else:
+            dataset_id = self.api.create_dataset(database_id, dataset['table_name'])
+
+        charts, dashboards = self.fetch()
+        chart_plan = self.plan_charts(charts, dataset_id)
+        chart_ids = {name: chart['id'] for name, chart in charts.items()}
+        for action, name, _, _ in chart_plan:
+            if action == 'create':
+                chart_ids[name] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            if not dry_run:
+                # Charts first: dashboards need the ids of new charts, and
+                # charts are deleted only once no dashboard references them
+                upserts = [op for op in chart_plan if op[0] != 'delete']
+                chart_ids.update(self._apply(pool, upserts, lambda *op: self._chart_write(*op, dataset_id), None))
+
+            dashboard_plan = self.plan_dashboards(dashboards, chart_ids)
+            if not dry_run:
+                self._apply(pool, dashboard_plan, self._dashboard_write, self.api.delete_dashboard)
+                deletes = [op for op in chart_plan if op[0] == 'delete']
+                self._apply(pool, deletes, None, self.api.delete_chart)
+
+        unchanged = len(self.spec.get('charts', [])) + len(self.spec.get('dashboards', [])) - sum(
+            1 for op in chart_plan + dashboard_plan if op[0] != 'delete')
+        print(f"\n🔁 {len(chart_plan)} chart and {len(dashboard_plan)} dashboard change(s), "
+              f"{unchanged} object(s) unchanged")
+        return {
+            'charts': [(action, name) for action, name, _, _ in chart_plan],
+            'dashboards': [(action, name) for action, name, _, _ in dashboard_plan],
+        }
+
+
+def print_plan(plan: dict):
+    symbols = {'create': '+', 'update': '~', 'delete': '-'}
+    for kind, ops in plan.items():
+        for action, name in ops:
+            print(f"   {symbols[action]} {kind[:-1]:9s} {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync charts and dashboards from a declarative spec")
+    parser.add_argument('spec', nargs='?', default=None,
+                        help="JSON spec (default: the built-in employment dashboards)")
+    parser.add_argument('--init', metavar='PATH', default=None,
+                        help="Write the built-in spec to PATH and exit")
+    parser.add_argument('--regions', nargs='+', metavar='RGSName', default=None,
+                        help="Built-in spec only: add one filtered dashboard per RGS office")
+    parser.add_argument('--namespace', default=None,
+                        help=f"Marks managed objects (default: from the spec, else '{DEFAULT_NAMESPACE}')")
+    parser.add_argument('--prune', action='store_true',
+                        help="Delete managed charts and dashboards that are not in the spec")
+    parser.add_argument('--dry-run', action='store_true', help="Print the plan without writing")
+    parser.add_argument('--workers', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Concurrent API requests (default {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--url', default="http://localhost:8088", help="Superset base URL")
+    args = parser.parse_args()
+
+    if args.init:
+        with open(args.init, 'w', encoding='utf-8') as f:
+            json.dump(default_spec(args.namespace or DEFAULT_NAMESPACE, args.regions), f,
+                      indent=2, ensure_ascii=False)
+        print(f"💾 Spec written to {args.init}")
+        sys.exit(0)
+
+    try:
+        spec = load_spec(args.spec) if args.spec else default_spec(DEFAULT_NAMESPACE, args.regions)
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid spec: {e}")
+        sys.exit(1)
+    if args.namespace:
+        spec['namespace'] = args.namespace
+
+    api = SupersetAPI(args.url)
+    api.login()
+
+    print(f"🔁 Syncing {len(spec.get('charts', []))} chart(s) and {len(spec.get('dashboards', []))} "
+          f"dashboard(s){' (dry run)' if args.dry_run else ''}...")
+    sync = DashboardSync(api, spec, args.prune, args.workers)
+    plan = sync.run(args.dry_run)
+    print_plan(plan)
+
+    if sync.failures:
+        print(f"⚠️  {len(sync.failures)} of {sync.writes} write(s) failed")
+        sys.exit(1)
+    print(f"✅ Done with {sync.writes} write(s)")
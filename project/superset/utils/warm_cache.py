@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Chart Cache Warm-Up
+
+Runs the data queries of every chart on the selected dashboards through the
+Superset API after an ingest, so the results are in the data cache
+(DATA_CACHE_CONFIG, Redis DB 2) before the first viewer opens a dashboard:
+
+  • Dashboards are selected by title (default: all), their charts listed
+    with one call per dashboard
+  • Each chart's saved query is run with at most --workers requests in flight
+  • Per-chart latency and cache hit/miss are reported
+
+Each chart runs its saved query context (/api/v1/chart/<id>/data/), the same
+query a dashboard without active filters sends. create_dashboard.py and
+sync_dashboards.py store one built from the chart's params; charts created
+elsewhere without one (never saved in Explore) are reported as skipped.
+
+Usage:
+    python warm_cache.py                                        # all dashboards
+    python warm_cache.py --dashboards "Austrian Employment Analysis" --workers 4
+"""
+
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from create_dashboard import SupersetAPI
+
+DEFAULT_WORKERS = 4
+
+
+def dashboard_charts(api: SupersetAPI, titles: list = None) -> dict:
+    """{chart_id: slice_name} of the charts on the dashboards (all if no titles)."""
+    if titles:
+        dashboard_ids = []
+        for title in titles:
+            dashboard_id = api.get_dashboard_id(title)
+            if dashboard_id is None:
+                print(f"⚠️  Dashboard not found: {title}")
+            else:
+                dashboard_ids.append(dashboard_id)
+    else:
+        dashboard_ids = [d['id'] for d in api.list_objects('dashboard', columns=['id'])]
+
+    charts = {}
+    for dashboard_id in dashboard_ids:
+        response = api._request('GET', f"/api/v1/dashboard/{dashboard_id}/charts")
+        response.raise_for_status()
+        for chart in response.json()["result"]:
+            charts[chart["id"]] = chart["slice_name"]
+    return charts
+
+
+def warm_chart(api: SupersetAPI, chart_id: int) -> dict:
+    """Run one chart's query; returns {'seconds', 'cached'} or {'skipped': reason}."""
+    start = time.perf_counter()
+    response = api._request('GET', f"/api/v1/chart/{chart_id}/data/")
+    if response.status_code == 400:
+        return {'skipped': response.json().get("message", "no saved query context")}
+    response.raise_for_status()
+    # One result per query of the chart - a hit only if all came from the cache
+    results = response.json()["result"]
+    return {
+        'seconds': time.perf_counter() - start,
+        'cached': bool(results) and all(result.get("is_cached") for result in results),
+    }
+
+
+def warm_cache(api: SupersetAPI, titles: list = None, max_workers: int = DEFAULT_WORKERS) -> dict:
+    """
+    Warm the data cache for the charts of the dashboards.
+    Returns {chart_id: result} with 'slice_name' and 'error' or the warm_chart() fields.
+    """
+    charts = dashboard_charts(api, titles)
+    print(f"🔥 Warming {len(charts)} chart(s), {max_workers} in flight...")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {pool.submit(warm_chart, api, chart_id): chart_id for chart_id in charts}
+        for future in as_completed(futures):
+            chart_id = futures[future]
+            try:
+                results[chart_id] = {'slice_name': charts[chart_id], **future.result()}
+            except Exception as e:
+                results[chart_id] = {'slice_name': charts[chart_id], 'error': str(e)}
+    return results
+
+
+def print_report(results: dict):
+    for chart_id, result in sorted(results.items(), key=lambda item: -item[1].get('seconds', 0)):
+        if 'error' in result:
+            print(f"   ❌ {chart_id:5d} {result['slice_name'][:48]:48s} {result['error']}")
+        elif 'skipped' in result:
+            print(f"   ⏭️  {chart_id:5d} {result['slice_name'][:48]:48s} skipped: {result['skipped']}")
+        else:
+            status = 'hit ' if result['cached'] else 'miss'
+            print(f"   {'✅' if result['cached'] else '🔥'} {chart_id:5d} {result['slice_name'][:48]:48s} "
+                  f"{result['seconds']:7.2f}s  {status}")
+
+    timings = sorted(result['seconds'] for result in results.values() if 'seconds' in result)
+    hits = sum(1 for result in results.values() if result.get('cached'))
+    skipped = sum(1 for result in results.values() if 'skipped' in result)
+    errors = sum(1 for result in results.values() if 'error' in result)
+    print(f"\n📊 {len(timings)} chart(s) warmed: {hits} hit, {len(timings) - hits} miss; "
+          f"{skipped} skipped, {errors} error(s)")
+    if timings:
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"   median {timings[len(timings) // 2]:.2f}s, p95 {p95:.2f}s, total {sum(timings):.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm the chart data cache of Superset dashboards")
+    parser.add_argument('--dashboards', nargs='+', metavar='TITLE', default=None,
+                        help="Dashboard titles (default: all dashboards)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Chart queries in flight (default {DEFAULT_WORKERS})")
+    parser.add_argument('--url', default="http://localhost:8088", help="Superset base URL")
+    args = parser.parse_args()
+
+    api = SupersetAPI(args.url)
+    api.login()
+    start = time.perf_counter()
+    results = warm_cache(api, args.dashboards, args.workers)
+    print_report(results)
+    print(f"⏱️  Warm-up took {time.perf_counter() - start:.1f}s")
+    if any('error' in result for result in results.values()):
+        sys.exit(1)